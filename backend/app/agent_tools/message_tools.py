@@ -9,9 +9,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Fixed fields of each message tool's result, spread into a fresh dict per call
+_INTERROGATIVE_BASE = {"success": True, "message_type": "interrogative"}
+_DECLARATIVE_BASE = {"success": True, "message_type": "declarative"}
+
 
 @tool
-def send_interrogative_message(content: str) -> Dict[str, Any]:
+async def send_interrogative_message(content: str) -> Dict[str, Any]:
     """
     Ask the user a clarifying question.
     Use this when you need a single, small piece of information to make progress.
@@ -22,19 +26,13 @@ def send_interrogative_message(content: str) -> Dict[str, Any]:
     Returns:
         dict: Message content and metadata
     """
-    logger.info("=" * 60)
-    logger.info("TOOL: send_interrogative_message")
-    logger.info(f"Question: {content}")
+    logger.debug("TOOL: send_interrogative_message - Question: %s", content)
 
-    return {
-        "success": True,
-        "message_type": "interrogative",
-        "content": content,
-    }
+    return {**_INTERROGATIVE_BASE, "content": content}
 
 
 @tool
-def send_declarative_message(content: str) -> Dict[str, Any]:
+async def send_declarative_message(content: str) -> Dict[str, Any]:
     """
     Send a supportive message or summary to the user.
     Use this when you've completed a task or need user confirmation.
@@ -45,12 +43,6 @@ def send_declarative_message(content: str) -> Dict[str, Any]:
     Returns:
         dict: Message content and metadata
     """
-    logger.info("=" * 60)
-    logger.info("TOOL: send_declarative_message")
-    logger.info(f"Message: {content}")
-
-    return {
-        "success": True,
-        "message_type": "declarative",
-        "content": content,
-    }
+    logger.debug("TOOL: send_declarative_message - Message: %s", content)
+
+    return {**_DECLARATIVE_BASE, "content": content}
@@ -1,6 +1,7 @@
 from langchain_core.tools import tool
 import logging
-from typing import Optional, List
+from operator import attrgetter
+from typing import Any, List, Optional, TypedDict
 from app.services.mongo_calendar_service import calendar_service
 from app.agent_tools.tool_context import get_current_user_id
 from datetime import datetime, timedelta, timezone
@@ -9,6 +10,70 @@ from datetime import datetime, timedelta, timezone
 logger = logging.getLogger(__name__)
 
 
+def _log_call(tool_name: str, **params) -> None:
+    """Log a tool invocation and its parameters as a single record."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("TOOL: %s %s", tool_name, params)
+
+
+# Row shapes returned by the query tools. TypedDicts are plain dicts at
+# runtime, so they document the schema the LLM sees without adding any
+# construction cost; the key tuples below are derived from them.
+class EventRow(TypedDict):
+    event_id: Any
+    title: str
+    date: str
+    start_time: str
+    duration: int
+    description: Optional[str]
+
+
+class PendingReminderRow(TypedDict):
+    reminder_id: Any
+    title: str
+    reminder_datetime: datetime
+    event_id: Optional[str]
+    priority: str
+
+
+class ReminderRow(PendingReminderRow):
+    status: str
+
+
+# Result keys and the matching document attributes for query tool rows
+_EVENT_KEYS = tuple(EventRow.__annotations__)
+_event_attrs = attrgetter(
+    "id", "title", "date", "start_time", "duration", "description"
+)
+_REMINDER_KEYS = tuple(ReminderRow.__annotations__)
+_reminder_attrs = attrgetter(
+    "id", "title", "reminder_datetime", "event_id", "priority", "status"
+)
+_PENDING_REMINDER_KEYS = tuple(PendingReminderRow.__annotations__)
+_pending_reminder_attrs = attrgetter(
+    "id", "title", "reminder_datetime", "event_id", "priority"
+)
+
+
+def _serialize_events(events) -> List[EventRow]:
+    """Convert CalendarEvent documents to the rows returned by query tools."""
+    return [dict(zip(_EVENT_KEYS, _event_attrs(event))) for event in events]
+
+
+async def _events_on_date_result(user_id: str, date: str) -> dict:
+    """Shared body of the single-day schedule tools."""
+    events = await calendar_service.get_events_on_date(user_id, date)
+    events_list = _serialize_events(events)
+
+    logger.info(f"✓ Found {len(events_list)} event(s) on {date}")
+    return {
+        "success": True,
+        "date": date,
+        "count": len(events_list),
+        "events": events_list,
+    }
+
+
 @tool
 async def get_events(start_date: str, end_date: Optional[str] = None) -> dict:
     """
@@ -19,32 +84,24 @@ async def get_events(start_date: str, end_date: Optional[str] = None) -> dict:
         end_date: End date in YYYY-MM-DD format (optional, defaults to start_date)
 
     Returns:
-        dict: List of events with their details and state update
+        dict: List of events with their details; `truncated` is true when the
+        range holds more events than were returned
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: get_events")
-    logger.info(
-        f"Parameters: user_id={user_id}, start_date={start_date}, end_date={end_date}"
-    )
+    _log_call("get_events", user_id=user_id, start_date=start_date, end_date=end_date)
 
-    events = await calendar_service.get_events_by_date_range(
+    events, truncated = await calendar_service.search_events(
         user_id, start_date, end_date
     )
+    events_list = _serialize_events(events)
 
-    events_list = [
-        {
-            "event_id": event.id,
-            "title": event.title,
-            "date": event.date,
-            "start_time": event.start_time,
-            "duration": event.duration,
-            "description": event.description,
-        }
-        for event in events
-    ]
-
-    result = {"success": True, "count": len(events_list), "events": events_list}
+    result = {
+        "success": True,
+        "count": len(events_list),
+        "events": events_list,
+        # More events matched than were returned; narrow the date range
+        "truncated": truncated,
+    }
 
     logger.info(f"✓ Found {len(events_list)} event(s)")
     return result
@@ -62,32 +119,37 @@ async def get_events_on_date(date: str) -> dict:
         dict: List of events for that date and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: get_events_on_date")
-    logger.info(f"Parameters: user_id={user_id}, date={date}")
+    _log_call("get_events_on_date", user_id=user_id, date=date)
 
-    events = await calendar_service.get_events_on_date(user_id, date)
+    return await _events_on_date_result(user_id, date)
 
-    events_list = [
-        {
-            "event_id": event.id,
-            "title": event.title,
-            "date": event.date,
-            "start_time": event.start_time,
-            "duration": event.duration,
-            "description": event.description,
-        }
-        for event in events
-    ]
+
+@tool
+async def get_schedule_batch(dates: List[str]) -> dict:
+    """
+    Get events for several dates in one call.
+    Prefer this over repeated get_events_on_date calls when comparing days.
+
+    Args:
+        dates: Dates in YYYY-MM-DD format (need not be consecutive)
+
+    Returns:
+        dict: Events grouped by date
+    """
+    user_id = get_current_user_id()
+    _log_call("get_schedule_batch", user_id=user_id, dates=dates)
+
+    schedule = await calendar_service.get_events_by_dates(user_id, dates)
 
     result = {
         "success": True,
-        "date": date,
-        "count": len(events_list),
-        "events": events_list,
+        "count": sum(len(events) for events in schedule.values()),
+        "schedule": {
+            date: _serialize_events(events) for date, events in schedule.items()
+        },
     }
 
-    logger.info(f"✓ Found {len(events_list)} event(s) on {date}")
+    logger.info(f"✓ Found {result['count']} event(s) across {len(dates)} date(s)")
     return result
 
 
@@ -111,10 +173,11 @@ async def find_available_slots(
         dict: List of available time slots and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: find_available_slots")
-    logger.info(
-        f"Parameters: user_id={user_id}, date={date}, duration={duration_minutes}min"
+    _log_call(
+        "find_available_slots",
+        user_id=user_id,
+        date=date,
+        duration=duration_minutes,
     )
 
     slots = await calendar_service.find_available_slots(
@@ -147,10 +210,12 @@ async def check_time_availability(date: str, start_time: str, duration: int) ->
         dict: Whether the time is available and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: check_time_availability")
-    logger.info(
-        f"Parameters: user_id={user_id}, date={date}, time={start_time}, duration={duration}min"
+    _log_call(
+        "check_time_availability",
+        user_id=user_id,
+        date=date,
+        time=start_time,
+        duration=duration,
     )
 
     is_available = await calendar_service.is_time_available(
@@ -191,10 +256,13 @@ async def create_calendar_event(
         dict: Created event details and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: create_calendar_event")
-    logger.info(
-        f"Parameters: user_id={user_id}, title={title}, date={date}, time={start_time}, duration={duration}min"
+    _log_call(
+        "create_calendar_event",
+        user_id=user_id,
+        title=title,
+        date=date,
+        time=start_time,
+        duration=duration,
     )
 
     event = await calendar_service.create_event(
@@ -253,11 +321,14 @@ async def update_calendar_event(
         dict: Updated event details or error and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: update_calendar_event")
-    logger.info(f"Parameters: user_id={user_id}, event_id={event_id}")
-    logger.info(
-        f"  Updates: title={title}, date={date}, time={start_time}, duration={duration}"
+    _log_call(
+        "update_calendar_event",
+        user_id=user_id,
+        event_id=event_id,
+        title=title,
+        date=date,
+        time=start_time,
+        duration=duration,
     )
 
     event = await calendar_service.update_event(
@@ -314,10 +385,11 @@ async def move_event_to_date(
         dict: Updated event details and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: move_event_to_date")
-    logger.info(
-        f"Parameters: event_id={event_id}, new_date={new_date}, new_time={new_start_time}"
+    _log_call(
+        "move_event_to_date",
+        event_id=event_id,
+        new_date=new_date,
+        new_time=new_start_time,
     )
 
     event = await calendar_service.update_event(
@@ -366,9 +438,7 @@ async def delete_calendar_event(event_id: str) -> dict:
         dict: Success status and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: delete_calendar_event")
-    logger.info(f"Parameters: user_id={user_id}, event_id={event_id}")
+    _log_call("delete_calendar_event", user_id=user_id, event_id=event_id)
 
     success = await calendar_service.delete_event(user_id, event_id)
 
@@ -398,11 +468,9 @@ async def get_todays_schedule() -> dict:
     mst_offset = timedelta(hours=-7)
     today_mst = (datetime.now(timezone.utc) + mst_offset).strftime("%Y-%m-%d")
 
-    logger.info("=" * 60)
-    logger.info("TOOL: get_todays_schedule")
-    logger.info(f"Parameters: user_id={user_id}, today={today_mst} (MST)")
+    _log_call("get_todays_schedule", user_id=user_id, today=today_mst)
 
-    return await get_events_on_date.ainvoke({"date": today_mst})
+    return await _events_on_date_result(user_id, today_mst)
 
 
 @tool
@@ -415,11 +483,9 @@ async def get_tomorrows_schedule() -> dict:
     """
     user_id = get_current_user_id()
     tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-    logger.info("=" * 60)
-    logger.info("TOOL: get_tomorrows_schedule")
-    logger.info(f"Parameters: user_id={user_id}, tomorrow={tomorrow}")
+    _log_call("get_tomorrows_schedule", user_id=user_id, tomorrow=tomorrow)
 
-    return await get_events_on_date.ainvoke({"date": tomorrow})
+    return await _events_on_date_result(user_id, tomorrow)
 
 
 @tool
@@ -434,11 +500,20 @@ async def get_week_schedule() -> dict:
     start_date = datetime.now().strftime("%Y-%m-%d")
     end_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
 
-    logger.info("=" * 60)
-    logger.info("TOOL: get_week_schedule")
-    logger.info(f"Parameters: user_id={user_id}, range={start_date} to {end_date}")
+    _log_call(
+        "get_week_schedule",
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    events = await calendar_service.get_events_by_date_range(
+        user_id, start_date, end_date
+    )
+    events_list = _serialize_events(events)
 
-    return await get_events.ainvoke({"start_date": start_date, "end_date": end_date})
+    logger.info(f"✓ Found {len(events_list)} event(s)")
+    return {"success": True, "count": len(events_list), "events": events_list}
 
 
 @tool
@@ -466,26 +541,25 @@ async def find_event_by_title(title_query: str, date: Optional[str] = None) -> d
         3. Call move_event_to_date(event_id="691317c99da9a2b1525f35c9", new_date="2025-11-12")
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: find_event_by_title")
-    logger.info(
-        f"Parameters: user_id={user_id}, title_query='{title_query}', date={date}"
+    _log_call(
+        "find_event_by_title",
+        user_id=user_id,
+        title_query=title_query,
+        date=date,
     )
 
-    # If date is provided, search only that date
+    # If date is provided, search only that date; otherwise search a wide
+    # range (past 30 days to next 365 days). The title is matched
+    # (case-insensitive, partial) by MongoDB, so the read cap only applies
+    # to matching events.
     if date:
-        events = await calendar_service.get_events_on_date(user_id, date)
+        start_date = end_date = date
     else:
-        # Search across a wide date range (past 30 days to next 365 days)
         start_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
         end_date = (datetime.now() + timedelta(days=365)).strftime("%Y-%m-%d")
-        events = await calendar_service.get_events_by_date_range(
-            user_id, start_date, end_date
-        )
-
-    # Filter events by title (case-insensitive partial match)
-    title_lower = title_query.lower()
-    matching_events = [event for event in events if title_lower in event.title.lower()]
+    matching_events, truncated = await calendar_service.search_events(
+        user_id, start_date, end_date, title_query=title_query
+    )
 
     events_list = [
         {
@@ -506,6 +580,7 @@ async def find_event_by_title(title_query: str, date: Optional[str] = None) -> d
         "query": title_query,
         "count": len(events_list),
         "events": events_list,
+        "truncated": truncated,
     }
 
     if len(events_list) == 0:
@@ -541,10 +616,11 @@ async def create_reminder(
         dict: Created reminder details and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: create_reminder")
-    logger.info(
-        f"Parameters: user_id={user_id}, title={title}, datetime={reminder_datetime}"
+    _log_call(
+        "create_reminder",
+        user_id=user_id,
+        title=title,
+        datetime=reminder_datetime,
     )
 
     reminder = await calendar_service.create_reminder(
@@ -593,9 +669,11 @@ async def create_reminder_for_event(
         dict: Created reminder details and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: create_reminder_for_event")
-    logger.info(f"Parameters: event_id={event_id}, minutes_before={minutes_before}")
+    _log_call(
+        "create_reminder_for_event",
+        event_id=event_id,
+        minutes_before=minutes_before,
+    )
 
     reminder = await calendar_service.create_reminder_for_event(
         user_id=user_id,
@@ -635,22 +713,12 @@ async def get_upcoming_reminders(hours_ahead: int = 24) -> dict:
         dict: List of upcoming reminders and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: get_upcoming_reminders")
-    logger.info(f"Parameters: user_id={user_id}, hours_ahead={hours_ahead}")
+    _log_call("get_upcoming_reminders", user_id=user_id, hours_ahead=hours_ahead)
 
     reminders = await calendar_service.get_upcoming_reminders(user_id, hours_ahead)
 
-    reminders_list = [
-        {
-            "reminder_id": reminder.id,
-            "title": reminder.title,
-            "reminder_datetime": reminder.reminder_datetime,
-            "event_id": reminder.event_id,
-            "priority": reminder.priority,
-            "status": reminder.status,
-        }
-        for reminder in reminders
+    reminders_list: List[ReminderRow] = [
+        dict(zip(_REMINDER_KEYS, _reminder_attrs(reminder))) for reminder in reminders
     ]
 
     result = {
@@ -672,20 +740,12 @@ async def get_pending_reminders() -> dict:
         dict: List of pending reminders and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: get_pending_reminders")
-    logger.info(f"Parameters: user_id={user_id}")
+    _log_call("get_pending_reminders", user_id=user_id)
 
     reminders = await calendar_service.get_pending_reminders(user_id)
 
-    reminders_list = [
-        {
-            "reminder_id": reminder.id,
-            "title": reminder.title,
-            "reminder_datetime": reminder.reminder_datetime,
-            "event_id": reminder.event_id,
-            "priority": reminder.priority,
-        }
+    reminders_list: List[PendingReminderRow] = [
+        dict(zip(_PENDING_REMINDER_KEYS, _pending_reminder_attrs(reminder)))
         for reminder in reminders
     ]
 
@@ -699,6 +759,38 @@ async def get_pending_reminders() -> dict:
     return result
 
 
+@tool
+async def get_reminder_dashboard(hours_ahead: int = 24) -> dict:
+    """
+    Get all pending reminders and the ones due soon in a single call.
+    Prefer this over calling get_pending_reminders and get_upcoming_reminders.
+
+    Args:
+        hours_ahead: How many hours ahead counts as upcoming (default 24)
+
+    Returns:
+        dict: Pending and upcoming reminders with their counts
+    """
+    user_id = get_current_user_id()
+    _log_call("get_reminder_dashboard", user_id=user_id, hours_ahead=hours_ahead)
+
+    dashboard = await calendar_service.get_reminder_dashboard(user_id, hours_ahead)
+
+    result = {
+        "success": True,
+        "pending_count": len(dashboard["pending"]),
+        "pending": dashboard["pending"],
+        "upcoming_count": len(dashboard["upcoming"]),
+        "upcoming": dashboard["upcoming"],
+    }
+
+    logger.info(
+        f"✓ Found {result['pending_count']} pending, "
+        f"{result['upcoming_count']} upcoming reminder(s)"
+    )
+    return result
+
+
 @tool
 async def mark_reminder_completed(reminder_id: str) -> dict:
     """
@@ -711,9 +803,7 @@ async def mark_reminder_completed(reminder_id: str) -> dict:
         dict: Success status and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: mark_reminder_completed")
-    logger.info(f"Parameters: user_id={user_id}, reminder_id={reminder_id}")
+    _log_call("mark_reminder_completed", user_id=user_id, reminder_id=reminder_id)
 
     success = await calendar_service.mark_reminder_completed(user_id, reminder_id)
 
@@ -740,9 +830,7 @@ async def snooze_reminder(reminder_id: str, snooze_minutes: int) -> dict:
         dict: Updated reminder details and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: snooze_reminder")
-    logger.info(f"Parameters: reminder_id={reminder_id}, snooze={snooze_minutes} min")
+    _log_call("snooze_reminder", reminder_id=reminder_id, snooze=snooze_minutes)
 
     reminder = await calendar_service.snooze_reminder(
         user_id, reminder_id, snooze_minutes
@@ -778,9 +866,7 @@ async def delete_reminder(reminder_id: str) -> dict:
         dict: Success status and state update
     """
     user_id = get_current_user_id()
-    logger.info("=" * 60)
-    logger.info("TOOL: delete_reminder")
-    logger.info(f"Parameters: user_id={user_id}, reminder_id={reminder_id}")
+    _log_call("delete_reminder", user_id=user_id, reminder_id=reminder_id)
 
     success = await calendar_service.delete_reminder(user_id, reminder_id)
 
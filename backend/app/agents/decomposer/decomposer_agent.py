@@ -8,13 +8,15 @@ It uses two tools to signal intent:
 """
 
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+import asyncio
 import logging
-import json
+import time
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-from app.services.openai_llmpool_service import llmpool
+from app.services.openai_llmpool_service import get_llmpool
 from app.utils.token_util import num_tokens_from_messages
+from app.utils.json_util import to_json
 from app.agent_tools.decomposer_action_tools import (
     ask_for_more_information,
     submit_final_plan,
@@ -23,6 +25,9 @@ from app.agent_tools.decomposer_action_tools import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Cap on waiting for an LLM slot plus the decomposition call itself
+DECOMPOSER_TIMEOUT_SECONDS = 20.0
+
 
 class DecomposerAgent:
     """
@@ -40,6 +45,8 @@ class DecomposerAgent:
         ]
 
         self.system_prompt = self._load_system_prompt()
+        # The prompt never changes, so build its message once and reuse it
+        self._system_message = SystemMessage(content=self.system_prompt)
         logger.info("Initialized DecomposerAgent")
 
     def _load_system_prompt(self) -> str:
@@ -71,18 +78,17 @@ class DecomposerAgent:
         Returns:
             Either batch questions or a final plan
         """
-        logger.info("=" * 60)
-        logger.info("DECOMPOSER AGENT: Processing request")
-        logger.info(f"Task: {task_description}")
-        logger.info(f"Deadline: {deadline}")
-        logger.info(f"Context: {context_dict}")
         logger.info(
-            f"Answers to previous questions: {len(answers_to_previous_questions) if answers_to_previous_questions else 0} answers"
+            "DECOMPOSER: task=%r deadline=%s answers=%d",
+            task_description,
+            deadline,
+            len(answers_to_previous_questions or ()),
         )
+        logger.debug("Decomposer context: %s", context_dict)
 
-        # Build the input message by formatting the template
+        # Build the input message
         # Create context text
-        context_text = json.dumps(context_dict or {}, indent=2)
+        context_text = to_json(context_dict or {})
 
         # Create answers text
         answers_text = ""
@@ -96,23 +102,21 @@ class DecomposerAgent:
         else:
             answers_text = "No previous answers"
 
-        # Replace template placeholders in system prompt
-        formatted_prompt = (
-            self.system_prompt.replace(
-                "{{task_description}}",
-                task_description or "No task description provided",
-            )
-            .replace("{{deadline}}", deadline or "No deadline specified")
-            .replace("{{context_dict}}", context_text)
-            .replace("{{answers_to_previous_questions}}", answers_text)
+        # The system prompt is sent unchanged on every call so its prefix can
+        # be served from the provider's prompt cache; only the request
+        # details vary, and they go in the user message.
+        request_text = (
+            f"Current Request:\n{task_description or 'No task description provided'}\n\n"
+            f"Deadline:\n{deadline or 'No deadline specified'}\n\n"
+            f"Context (includes available time before deadline):\n{context_text}\n\n"
+            f"Answers to Previous Questions (if any):\n{answers_text}\n\n"
+            "Analyze the task and decide: ask_for_more_information or submit_final_plan?"
         )
 
         # Build messages for LLM
         messages: List[Any] = [
-            SystemMessage(content=formatted_prompt),
-            HumanMessage(
-                content="Analyze the task and decide: ask_for_more_information or submit_final_plan?"
-            ),
+            self._system_message,
+            HumanMessage(content=request_text),
         ]
 
         try:
@@ -120,54 +124,60 @@ class DecomposerAgent:
             tokens_needed = num_tokens_from_messages(messages, model_name="gpt-4o")
             tokens_needed += 4000  # Increased buffer for detailed breakdown response
 
-            logger.info(
-                f"Token allocation: {tokens_needed} tokens (prompt + 4000 buffer)"
+            logger.debug(
+                "Token allocation: %d tokens (prompt + 4000 buffer)", tokens_needed
             )
 
-            # Borrow LLM from pool
-            slot, lock_token = await llmpool.borrow_llm(tokens_needed)
-            llm_with_tools = slot.llm.bind_tools(self.tools)
+            # Borrow LLM from pool; waiting for a slot and the call share one
+            # budget so a saturated pool can't hang the calling chat turn
+            llmpool = get_llmpool()
+            deadline = time.monotonic() + DECOMPOSER_TIMEOUT_SECONDS
+            slot, lock_token = await llmpool.borrow_llm(
+                tokens_needed, timeout_in_seconds=DECOMPOSER_TIMEOUT_SECONDS
+            )
+            try:
+                llm_with_tools = slot.llm.bind_tools(self.tools)
 
-            logger.debug(f"Borrowed LLM slot '{slot.name}' for decomposer")
+                logger.debug("Borrowed LLM slot '%s' for decomposer", slot.name)
 
-            # Call LLM with tools (async)
-            response = await llm_with_tools.ainvoke(messages)
+                # Call LLM with tools (async)
+                response = await asyncio.wait_for(
+                    llm_with_tools.ainvoke(messages),
+                    timeout=max(deadline - time.monotonic(), 0),
+                )
+            except BaseException:
+                llmpool.return_llm(slot, lock_token)
+                raise
 
             # Log raw response for debugging
-            logger.debug("=" * 60)
-            logger.debug("RAW LLM RESPONSE:")
-            logger.debug(f"Response type: {type(response)}")
-            logger.debug(
-                f"Response content: {response.content if hasattr(response, 'content') else 'N/A'}"
-            )
-            logger.debug(
-                f"Tool calls count: {len(response.tool_calls) if hasattr(response, 'tool_calls') else 0}"
-            )
-            if hasattr(response, "response_metadata"):
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    f"Response metadata: {json.dumps(response.response_metadata, indent=2, default=str)}"
+                    "Decomposer raw response: content=%r tool_calls=%d metadata=%s",
+                    response.content,
+                    len(response.tool_calls),
+                    to_json(response.response_metadata),
                 )
-            logger.debug("=" * 60)
 
             # Track token usage
             actual_tokens = tokens_needed
-            if hasattr(response, "response_metadata"):
-                usage = response.response_metadata.get("token_usage", {})
-                if usage:
-                    actual_tokens = usage.get("prompt_tokens", 0) + usage.get(
-                        "completion_tokens", 0
-                    )
-                    logger.info(
-                        f"Actual token usage: {actual_tokens} tokens (prompt: {usage.get('prompt_tokens', 0)}, completion: {usage.get('completion_tokens', 0)})"
-                    )
+            usage = response.response_metadata.get("token_usage", {})
+            if usage:
+                actual_tokens = usage.get("prompt_tokens", 0) + usage.get(
+                    "completion_tokens", 0
+                )
+                logger.debug(
+                    "Actual token usage: %d tokens (prompt: %d, completion: %d)",
+                    actual_tokens,
+                    usage.get("prompt_tokens", 0),
+                    usage.get("completion_tokens", 0),
+                )
 
-                    # Check for finish reason
-                    finish_reason = response.response_metadata.get(
-                        "finish_reason", "unknown"
-                    )
-                    logger.info(f"Finish reason: {finish_reason}")
-                    if finish_reason == "length":
-                        logger.warning("⚠️  Response was truncated due to length limit!")
+                # Check for finish reason
+                finish_reason = response.response_metadata.get(
+                    "finish_reason", "unknown"
+                )
+                if finish_reason == "length":
+                    logger.warning("⚠️  Response was truncated due to length limit!")
 
             llmpool.record_slot_usage(slot, actual_tokens)
             llmpool.return_llm(slot, lock_token)
@@ -175,9 +185,7 @@ class DecomposerAgent:
             # Check if tools were called
             if not response.tool_calls:
                 logger.error("Decomposer didn't call any tools - protocol violation")
-                logger.error(
-                    f"Response content: {response.content if hasattr(response, 'content') else 'N/A'}"
-                )
+                logger.error("Response content: %s", response.content)
                 return {
                     "success": False,
                     "error": "Decomposer failed to use required tools",
@@ -189,20 +197,13 @@ class DecomposerAgent:
             tool_name = tool_call["name"]
             tool_args = tool_call["args"]
 
-            logger.info(f"Decomposer called: {tool_name}")
-            logger.info(f"Raw tool_call structure:")
-            logger.info(json.dumps(tool_call, indent=2, default=str))
-            logger.info(
-                f"Tool args keys: {list(tool_args.keys()) if tool_args else 'empty dict'}"
-            )
-            if tool_args:
-                logger.info(f"Tool args size: ~{len(json.dumps(tool_args))} characters")
+            logger.info("Decomposer called: %s", tool_name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Decomposer tool call: %s", to_json(tool_call))
 
             if tool_name == "ask_for_more_information":
                 questions = tool_args.get("questions", [])
-                logger.info(f"📋 Batch questions: {len(questions)} question(s)")
-                for i, q in enumerate(questions, 1):
-                    logger.debug(f"  Q{i}: {q.get('question', '???')[:60]}...")
+                logger.info("📋 Batch questions: %d question(s)", len(questions))
 
                 return {
                     "success": True,
@@ -217,7 +218,7 @@ class DecomposerAgent:
                 subtasks = tool_args.get("subtasks", [])
 
                 logger.info(
-                    f"✓ Final plan submitted: {main_task.get('title', 'Untitled')}"
+                    "✓ Final plan submitted: %s", main_task.get("title", "Untitled")
                 )
 
                 # Assemble breakdown from tool_args
@@ -230,15 +231,11 @@ class DecomposerAgent:
                     "suggested_breaks": tool_args.get("suggested_breaks", []),
                 }
 
-                # Log the entire breakdown for debugging
-                logger.debug("Full breakdown structure assembled from tool args:")
-                logger.debug(json.dumps(breakdown, indent=2, default=str))
-
                 # Validate the breakdown
                 if not self._validate_breakdown(breakdown):
                     logger.error("Invalid breakdown structure")
                     logger.error("Full breakdown that failed validation:")
-                    logger.error(json.dumps(breakdown, indent=2, default=str))
+                    logger.error(to_json(breakdown))
                     return {
                         "success": False,
                         "error": "Invalid breakdown structure",
@@ -327,7 +324,7 @@ class DecomposerAgent:
                     logger.error(f"Subtask {i} keys present: {list(subtask.keys())}")
                     return False
 
-            logger.info("✓ Breakdown validation passed")
+            logger.debug("✓ Breakdown validation passed")
             return True
 
         except Exception as e:
@@ -4,15 +4,22 @@ Uses compassionate, neurodiversity-aware prompting with state management.
 """
 
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
+from langchain_core.runnables import Runnable
 import logging
 import asyncio
-import json
-from typing import List, Dict, Any, Optional, Callable
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Callable, Mapping, Awaitable
 from datetime import datetime
 
 from app.agent_tools.mongo_tools import (
     get_events,
     get_events_on_date,
+    get_schedule_batch,
     get_todays_schedule,
     get_tomorrows_schedule,
     get_week_schedule,
@@ -27,6 +34,7 @@ from app.agent_tools.mongo_tools import (
     create_reminder_for_event,
     get_upcoming_reminders,
     get_pending_reminders,
+    get_reminder_dashboard,
     mark_reminder_completed,
     snooze_reminder,
     delete_reminder,
@@ -47,13 +55,235 @@ from app.agent_tools.tool_context import (
     reset_current_user_id,
 )
 from app.services.conversation_service import conversation_service
-from app.services.openai_llmpool_service import llmpool
+from app.services.openai_llmpool_service import get_llmpool
+from app.models.llmslot import LLMSlot
 from app.utils.token_util import num_tokens_from_messages
-from app.config import OPENAI_MODEL
+from app.utils.json_util import to_json
+from app.config import OPENAI_MODEL, TOOL_CONCURRENCY
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on tool calls executed concurrently within one iteration
+MAX_CONCURRENT_TOOL_CALLS = TOOL_CONCURRENCY
+
+# Wall-clock budget for one chat turn, and cap on any single LLM call
+CHAT_TIME_BUDGET_SECONDS = 30.0
+LLM_CALL_TIMEOUT_SECONDS = 20.0
+
+# Max in-turn transcript messages (after system + user) re-sent to the LLM
+MAX_HISTORY_MESSAGES = 20
+
+# Max list items (events, reminders, slots) kept in a tool result for the LLM
+MAX_TOOL_RESULT_ITEMS = 20
+
+# Tool results from older iterations are replaced by one-line summaries
+KEEP_FULL_TOOL_ITERATIONS = 3
+
+# Pure small-talk messages that can be answered without an LLM round-trip
+_SMALLTALK = re.compile(
+    r"^\s*(?:(?P<greeting>hi|hey|hello)|(?P<thanks>thanks|thank you)"
+    r"|(?P<ack>ok(?:ay)?|cool|great))[!.\s]*$",
+    re.IGNORECASE,
+)
+_SMALLTALK_REPLIES = {
+    "greeting": "Hey! 👋 I'm here. What's on your mind today?",
+    "thanks": "Anytime! 💛 Just let me know if there's anything else I can help with.",
+    "ack": "👍 I'm here whenever you need me.",
+}
+
+# Simple single-lookup requests that the fast model handles well; anything
+# that asks for a change goes to the full model
+_SIMPLE_QUERY = re.compile(
+    r"^(?!.*\b(?:delete|remove|clear|cancel|move|reschedule|postpone|push|add|"
+    r"create|book|schedule (?:me|a|an)|snooze|update|change|mark|drop)\b)"
+    r"\s*(?:what(?:'s| is| do i have)|show(?: me)?|list|any)\b.{0,60}?"
+    r"\b(?:today|tonight|tomorrow|this week|schedule|calendar|reminders?)\b[?!.\s]*$",
+    re.IGNORECASE,
+)
+
+# All available tools exposed to the ReAct LLM
+TOOLS = (
+    # State management
+    update_working_state,
+    reset_conversation_state,
+    # Task decomposition
+    talk_to_decomposer_agent,
+    # Calendar query tools
+    get_events,
+    get_events_on_date,
+    get_schedule_batch,
+    get_todays_schedule,
+    get_tomorrows_schedule,
+    get_week_schedule,
+    find_event_by_title,
+    # Availability tools
+    find_available_slots,
+    check_time_availability,
+    # Event management tools
+    create_calendar_event,
+    update_calendar_event,
+    move_event_to_date,
+    delete_calendar_event,
+    # Reminder tools
+    create_reminder,
+    create_reminder_for_event,
+    get_upcoming_reminders,
+    get_pending_reminders,
+    get_reminder_dashboard,
+    mark_reminder_completed,
+    snooze_reminder,
+    delete_reminder,
+    # Message tools
+    send_interrogative_message,
+    send_declarative_message,
+)
+
+# Side-effect-free tools whose results can be reused within a single turn
+_READONLY_TOOLS = frozenset(
+    {
+        "get_events",
+        "get_events_on_date",
+        "get_schedule_batch",
+        "get_todays_schedule",
+        "get_tomorrows_schedule",
+        "get_week_schedule",
+        "find_event_by_title",
+        "find_available_slots",
+        "check_time_availability",
+        "get_upcoming_reminders",
+        "get_pending_reminders",
+        "get_reminder_dashboard",
+    }
+)
+
+# Tools that change calendar/reminder data and invalidate cached reads
+_MUTATING_TOOLS = frozenset(
+    {
+        "create_calendar_event",
+        "update_calendar_event",
+        "move_event_to_date",
+        "delete_calendar_event",
+        "create_reminder",
+        "create_reminder_for_event",
+        "mark_reminder_completed",
+        "snooze_reminder",
+        "delete_reminder",
+    }
+)
+
+# Read-only tool registry used to dispatch LLM tool calls by name, mapping
+# name -> (tool, is_readonly); keyed by each tool's own name so it can't
+# drift from what the LLM is shown
+_TOOL_MAP: Mapping[str, tuple[Any, bool]] = MappingProxyType(
+    {tool.name: (tool, tool.name in _READONLY_TOOLS) for tool in TOOLS}
+)
+
+
+def _load_mega_prompt() -> str:
+    """Load the mega prompt template from file."""
+    prompt_file = Path(__file__).parent / "mega_prompt.txt"
+    try:
+        return prompt_file.read_text()
+    except Exception as e:
+        logger.error(f"Failed to load mega_prompt.txt: {e}")
+        raise RuntimeError("Mega prompt file is missing.")
+
+
+# Read once at import; every agent shares the same template string
+MEGA_PROMPT = _load_mega_prompt()
+
+# The template split around its {{...}} fields: literal segments alternate
+# with field names, so populating it is a single join
+_PROMPT_SEGMENTS = re.split(
+    r"\{\{(Last 5 messages|last_state_json|last_tool_actions_and_result)\}\}",
+    MEGA_PROMPT,
+)
+_PROMPT_LITERALS = tuple(_PROMPT_SEGMENTS[0::2])
+_PROMPT_FIELDS = tuple(_PROMPT_SEGMENTS[1::2])
+
+# Tools whose call ends the iteration with a message to the user
+_MESSAGE_TOOLS = frozenset({"send_interrogative_message", "send_declarative_message"})
+
+# Tools offered on the fast path: lookups, state, and the reply itself, so
+# a misrouted write request can't be acted on by the fast model
+_FAST_TOOLS = tuple(
+    tool
+    for tool in TOOLS
+    if tool.name in _READONLY_TOOLS
+    or tool.name in _MESSAGE_TOOLS
+    or tool.name in {"update_working_state", "reset_conversation_state"}
+)
+
+# Final-reply saves still in flight; held here so they aren't garbage
+# collected, and drained on app shutdown
+_background_saves: set[asyncio.Task] = set()
+
+
+@lru_cache(maxsize=64)
+def _get_llm_with_tools(slot: LLMSlot, fast: bool = False) -> Runnable:
+    """
+    Bind the agent tools to a pool slot's LLM once and reuse the result.
+
+    bind_tools converts every tool into an OpenAI JSON schema; slots are
+    long-lived, so doing that per iteration is wasted work. The fast model
+    only gets the read-only tools.
+    """
+    if fast:
+        return slot.fast_llm.bind_tools(list(_FAST_TOOLS), parallel_tool_calls=True)
+    return slot.llm.bind_tools(list(TOOLS), parallel_tool_calls=True)
+
+
+@lru_cache(maxsize=64)
+def _unknown_tool_error(tool_name: str) -> Dict[str, str]:
+    """Error result for a tool name the LLM made up, built once per name."""
+    return {"error": f"Unknown tool: {tool_name}"}
+
+
+def _compact_tool_result(result: Any) -> str:
+    """
+    Render a tool result as compact JSON for the LLM.
+
+    Datetimes are rendered to the minute, which is all the LLM needs.
+    Long lists are cut to MAX_TOOL_RESULT_ITEMS (with a count of what was
+    dropped) and the update_working_state echo of the state is omitted -
+    the prompt already carries the state.
+    """
+    if isinstance(result, dict):
+        compact: Dict[str, Any] = {}
+        for key, value in result.items():
+            if key == "state_dict":
+                continue
+            if isinstance(value, list) and len(value) > MAX_TOOL_RESULT_ITEMS:
+                compact[key] = value[:MAX_TOOL_RESULT_ITEMS]
+                compact[f"{key}_omitted"] = len(value) - MAX_TOOL_RESULT_ITEMS
+            else:
+                compact[key] = value
+        result = compact
+    return to_json(result, minutes=True)
+
+
+def _summarize_tool_result(tool_name: str, result: Any) -> str:
+    """One-line stand-in for a tool result from an earlier iteration."""
+    if isinstance(result, dict):
+        if result.get("error") or result.get("success") is False:
+            return f"<{tool_name}: failed - {result.get('error') or result.get('message')}>"
+        if "count" in result:
+            return f"<{tool_name}: {result['count']} result(s), shown earlier>"
+    return f"<{tool_name}: done, result shown earlier>"
+
+
+def _on_background_save_done(task: asyncio.Task) -> None:
+    _background_saves.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Failed to save assistant reply: %r", task.exception())
+
+
+async def drain_background_saves() -> None:
+    """Wait for reply saves still in flight (called on app shutdown)."""
+    if _background_saves:
+        await asyncio.gather(*_background_saves, return_exceptions=True)
+
 
 class ReactCalendarAgent:
     """
@@ -66,57 +296,20 @@ class ReactCalendarAgent:
         self.user_id = user_id
         # We no longer create our own LLM - we'll borrow from the pool
 
-        # All available tools (now including update_working_state and talk_to_decomposer_agent)
-        self.tools = [
-            # State management (MANDATORY)
-            update_working_state,
-            reset_conversation_state,
-            # Task decomposition
-            talk_to_decomposer_agent,
-            # Calendar query tools
-            get_events,
-            get_events_on_date,
-            get_todays_schedule,
-            get_tomorrows_schedule,
-            get_week_schedule,
-            find_event_by_title,
-            # Availability tools
-            find_available_slots,
-            check_time_availability,
-            # Event management tools
-            create_calendar_event,
-            update_calendar_event,
-            move_event_to_date,
-            delete_calendar_event,
-            # Reminder tools
-            create_reminder,
-            create_reminder_for_event,
-            get_upcoming_reminders,
-            get_pending_reminders,
-            mark_reminder_completed,
-            snooze_reminder,
-            delete_reminder,
-            # Message tools
-            send_interrogative_message,
-            send_declarative_message,
-        ]
-
-        # Load the mega prompt
-        self.system_prompt_template = self._load_mega_prompt()
-
         # Callback for sending messages to user (set by websocket handler)
         self.message_callback: Optional[Callable[[str], None]] = None
 
-        logger.info(f"Initialized ReAct agent for user: {user_id}")
+        # Today's schedule fetched alongside the first LLM call of a session
+        self._schedule_prefetch: Optional[asyncio.Task] = None
+        self._prefetch_started = False
 
-    def _load_mega_prompt(self) -> str:
-        """Load the mega prompt template from file."""
-        try:
-            with open("app/agents/react/mega_prompt.txt", "r") as f:
-                return f.read()
-        except Exception as e:
-            logger.error(f"Failed to load mega_prompt.txt: {e}")
-            raise RuntimeError("Mega prompt file is missing.")
+        # Previous turn's reply save, awaited before this turn touches history
+        self._pending_save: Optional[asyncio.Task] = None
+
+        # Read-only tool results reused within the current turn
+        self._turn_cache: Dict[tuple[str, str], Any] = {}
+
+        logger.info("Initialized ReAct agent for user: %s", user_id)
 
     async def _populate_prompt(self) -> str:
         """
@@ -126,6 +319,10 @@ class ReactCalendarAgent:
         - {{Last 5 messages}}
         - {{last_state_json}}
         - {{last_tool_actions_and_result}}
+
+        All dynamic fields live in the Context section at the very end of the
+        template, so the long static instructions form an identical prefix on
+        every call and hit OpenAI's automatic prompt cache.
         """
         # Get recent messages
         recent_messages = await conversation_service.format_recent_messages(
@@ -134,39 +331,43 @@ class ReactCalendarAgent:
 
         # Get current conversation state
         current_state = conversation_service.get_conversation_state(self.user_id)
-        state_json = current_state.model_dump_json(indent=2)
+        state_json = conversation_service.get_conversation_state_json(self.user_id)
 
         # Format last tool actions and results from conversation state
         # This includes all tools called in the last iteration
-        last_tool_info = self._format_last_tool_calls()
+        last_tool_info = self._format_last_tool_calls(current_state)
 
-        # Populate the template
-        prompt = self.system_prompt_template
-        prompt = prompt.replace("{{Last 5 messages}}", recent_messages)
-        prompt = prompt.replace("{{last_state_json}}", state_json)
-        prompt = prompt.replace("{{last_tool_actions_and_result}}", last_tool_info)
+        # Populate the template in one pass over its pre-split segments
+        values = {
+            "Last 5 messages": recent_messages,
+            "last_state_json": state_json,
+            "last_tool_actions_and_result": last_tool_info,
+        }
+        parts = [_PROMPT_LITERALS[0]]
+        for field, literal in zip(_PROMPT_FIELDS, _PROMPT_LITERALS[1:]):
+            parts.append(values[field])
+            parts.append(literal)
 
         # Add current date
         current_date = datetime.now().strftime("%Y-%m-%d")
-        prompt = f"{prompt}\n\nCurrent date: {current_date}"
+        parts.append(f"\n\nCurrent date: {current_date}")
 
-        return prompt
+        return "".join(parts)
 
-    def _format_last_tool_calls(self) -> str:
+    def _format_last_tool_calls(self, current_state: Any) -> str:
         """
         Format the last iteration's tool calls and results for the prompt.
-        Retrieves this information from the conversation state.
+        Takes the conversation state already read by _populate_prompt.
         """
-        current_state = conversation_service.get_conversation_state(self.user_id)
-
         # Check if we have tracked tool calls in the state
-        if hasattr(current_state, "last_tool_calls") and current_state.last_tool_calls:
-            tool_calls_summary = []
-            for call in current_state.last_tool_calls:
-                tool_name = call.get("tool_name", "unknown")
-                result = call.get("result", {})
-                tool_calls_summary.append(f"Tool: {tool_name}\nResult: {result}\n")
-            return "\n".join(tool_calls_summary)
+        if current_state.last_tool_calls:
+            # Results as compact JSON, the same rendering the LLM saw them in,
+            # rather than Python reprs
+            return "\n".join(
+                f"Tool: {call.get('tool_name', 'unknown')}\n"
+                f"Result: {_compact_tool_result(call.get('result', {}))}\n"
+                for call in current_state.last_tool_calls
+            )
 
         return "No previous tool calls"
 
@@ -182,16 +383,14 @@ class ReactCalendarAgent:
         this updates that tool's result with the current user_message.
         """
         current_state = conversation_service.get_conversation_state(self.user_id)
-        if hasattr(current_state, "last_tool_calls") and current_state.last_tool_calls:
+        if current_state.last_tool_calls:
             last_tool = current_state.last_tool_calls[-1]
             last_tool_name = last_tool.get("tool_name", "")
 
-            if last_tool_name in [
-                "send_interrogative_message",
-                "send_declarative_message",
-            ]:
+            if last_tool_name in _MESSAGE_TOOLS:
                 logger.info(
-                    f"Last iteration ended with {last_tool_name}, injecting user response into result"
+                    "Last iteration ended with %s, injecting user response into result",
+                    last_tool_name,
                 )
 
                 # Update the result of the last message tool with user's response
@@ -201,159 +400,340 @@ class ReactCalendarAgent:
                 }
 
                 # Save the updated state
-                conversation_service.update_conversation_state(
-                    self.user_id, {"last_tool_calls": current_state.last_tool_calls}
+                conversation_service.update_conversation_field(
+                    self.user_id, "last_tool_calls", current_state.last_tool_calls
                 )
-                logger.info(f"✓ User response injected into {last_tool_name} result")
+                logger.info("✓ User response injected into %s result", last_tool_name)
+
+    def _smalltalk_reply(self, user_message: str, current_state: Any) -> Optional[str]:
+        """
+        Return a canned reply for pure small talk, or None to run the ReAct loop.
+
+        Only applies when no conversation is in flight (no previous tool calls,
+        or the last iteration reset the conversation), so a bare "ok" that
+        answers one of Chiku's questions still reaches the LLM.
+        """
+        match = _SMALLTALK.match(user_message)
+        if not match or not self._is_idle(current_state):
+            return None
+
+        return _SMALLTALK_REPLIES[match.lastgroup]
+
+    def _is_simple_query(self, user_message: str, current_state: Any) -> bool:
+        """
+        Whether this turn is a standalone lookup the fast model can handle.
+
+        Multi-step work (rescheduling, planning, answering an open question)
+        keeps the main model.
+        """
+        return bool(_SIMPLE_QUERY.match(user_message)) and self._is_idle(
+            current_state
+        )
+
+    @staticmethod
+    def _is_idle(current_state: Any) -> bool:
+        """No conversation in flight: no previous tool calls, or it was reset."""
+        last_tool_calls = current_state.last_tool_calls
+        return not last_tool_calls or any(
+            call.get("tool_name") == "reset_conversation_state"
+            for call in last_tool_calls
+        )
+
+    def _summarize_old_tool_messages(self, messages: List[Any]) -> None:
+        """
+        Replace tool results older than KEEP_FULL_TOOL_ITERATIONS with their
+        one-line summaries, in place, so they stop inflating every prompt.
+        """
+        ai_seen = 0
+        for message in reversed(messages):
+            if isinstance(message, AIMessage):
+                ai_seen += 1
+            elif (
+                ai_seen >= KEEP_FULL_TOOL_ITERATIONS
+                and isinstance(message, ToolMessage)
+                and message.artifact
+            ):
+                message.content = message.artifact
+                message.artifact = None
+
+    def _trim_messages(self, messages: List[Any]) -> List[Any]:
+        """
+        Bound the transcript sent to the LLM on each iteration.
+
+        Always keeps the system prompt and the user message, plus the most
+        recent MAX_HISTORY_MESSAGES. The kept tail starts at an AIMessage so
+        every ToolMessage still follows the tool call it answers.
+        """
+        head, tail = messages[:2], messages[2:]
+        if len(tail) <= MAX_HISTORY_MESSAGES:
+            return messages
+
+        start = len(tail) - MAX_HISTORY_MESSAGES
+        while start < len(tail) and not isinstance(tail[start], AIMessage):
+            start += 1
+        return head + tail[start:]
 
     def _validate_tool_calls(self, tool_calls: List[Dict[str, Any]]) -> None:
         """
         Validate tool calls against protocol requirements.
 
-        Logs warnings/errors for violations:
+        Logs a single error record listing any violations:
         - Minimum 2 tool calls (state + action)
         - First tool call should be update_working_state
         """
+        problems = []
+
         # Check minimum 2 tool calls (state + action)
         if len(tool_calls) < 2:
-            logger.error(
-                f"Protocol violation: Only {len(tool_calls)} tool call(s). Minimum is 2 (state + action)"
+            problems.append(
+                f"only {len(tool_calls)} tool call(s), minimum is 2 (state + action)"
             )
 
         # Check that first tool call is update_working_state
         first_tool_name = tool_calls[0]["name"]
         if first_tool_name != "update_working_state":
+            problems.append(
+                f"first tool call should be update_working_state, got {first_tool_name}"
+            )
+
+        if problems:
             logger.error(
-                f"Protocol violation: First tool call should be update_working_state, got {first_tool_name}"
+                "Protocol violation: %s (tools=%s)",
+                "; ".join(problems),
+                [tool_call["name"] for tool_call in tool_calls],
             )
 
+    async def _stream_llm(
+        self,
+        llm_with_tools: Runnable,
+        messages: List[Any],
+        stream_callback: Callable[[str], Awaitable[None]],
+    ) -> Any:
+        """
+        Stream the LLM response, forwarding message tool text as it arrives.
+
+        The user-facing reply is the `content` argument of a message tool call,
+        so deltas of that argument are pushed to the stream callback while the
+        full response is accumulated and returned as usual.
+        """
+        response = None
+        sent = 0
+        async for chunk in llm_with_tools.astream(messages):
+            response = chunk if response is None else response + chunk
+            # tool_calls on the accumulated chunk are parsed from partial JSON
+            for tool_call in response.tool_calls:
+                if tool_call["name"] not in _MESSAGE_TOOLS:
+                    continue
+                content = tool_call["args"].get("content")
+                if isinstance(content, str) and len(content) > sent:
+                    await stream_callback(content[sent:])
+                    sent = len(content)
+                break
+        return response
+
     async def _borrow_llm_and_invoke(
-        self, messages: List[Any], iteration: int
+        self,
+        messages: List[Any],
+        iteration: int,
+        timeout: float,
+        fast: bool = False,
+        stream_callback: Optional[Callable[[str], Awaitable[None]]] = None,
     ) -> Optional[Any]:
         """
         Borrow an LLM from the pool, invoke it with messages, and return it.
 
+        Waiting for a slot and the call itself share one `timeout` (seconds),
+        so a saturated pool can't stall the turn. The slot is always returned
+        to the pool, even when the call fails or times out.
+
         Returns the LLM response or None if an error occurred.
         """
         # Calculate tokens needed for this request
         tokens_needed = num_tokens_from_messages(messages, model_name=OPENAI_MODEL)
         tokens_needed += 5000  # Buffer for response
 
-        logger.debug(f"Estimated tokens needed: {tokens_needed}")
+        logger.debug("Estimated tokens needed: %d", tokens_needed)
 
+        llmpool = get_llmpool()
+        slot = None
+        lock_token = ""
+        deadline = time.monotonic() + timeout
         try:
-            # Borrow LLM from pool
-            slot, lock_token = await llmpool.borrow_llm(tokens_needed)
-            llm_with_tools = slot.llm.bind_tools(self.tools)
+            # Borrow LLM from pool, giving up once the budget is spent
+            slot, lock_token = await llmpool.borrow_llm(
+                tokens_needed, timeout_in_seconds=timeout
+            )
+            llm_with_tools = _get_llm_with_tools(slot, fast)
 
-            logger.debug(f"Borrowed LLM slot '{slot.name}' for iteration {iteration}")
+            logger.debug("Borrowed LLM slot '%s' for iteration %d", slot.name, iteration)
 
-            # Call LLM with tools
-            response = llm_with_tools.invoke(messages)
+            # Call LLM with tools (async, so other sessions keep being served)
+            if stream_callback:
+                call = self._stream_llm(llm_with_tools, messages, stream_callback)
+            else:
+                call = llm_with_tools.ainvoke(messages)
+            response = await asyncio.wait_for(
+                call, timeout=max(deadline - time.monotonic(), 0)
+            )
 
             # Extract actual token usage
             actual_tokens = tokens_needed
-            if hasattr(response, "response_metadata"):
-                usage = response.response_metadata.get("token_usage", {})
-                if usage:
-                    actual_tokens = usage.get("prompt_tokens", 0) + usage.get(
-                        "completion_tokens", 0
-                    )
-                    logger.debug(f"Actual tokens used: {actual_tokens}")
+            usage = response.response_metadata.get("token_usage", {})
+            if usage:
+                actual_tokens = usage.get("prompt_tokens", 0) + usage.get(
+                    "completion_tokens", 0
+                )
+                logger.debug("Actual tokens used: %d", actual_tokens)
 
-            # Record usage and return the slot
+            # Record usage; the slot is returned in finally
             llmpool.record_slot_usage(slot, actual_tokens)
-            llmpool.return_llm(slot, lock_token)
 
             return response
 
+        except (asyncio.TimeoutError, TimeoutError):
+            logger.warning(
+                "LLM call timed out after %.1fs (iteration %d)", timeout, iteration
+            )
+            return None
         except ValueError as e:
-            logger.error(f"Error using LLM slot: {e}")
+            logger.error("Error using LLM slot: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error invoking LLM: {e}", exc_info=True)
+            logger.error("Unexpected error invoking LLM: %s", e, exc_info=True)
             return None
+        finally:
+            if slot is not None:
+                llmpool.return_llm(slot, lock_token)
 
     async def _execute_tools_in_parallel(
         self, tool_calls: List[Dict[str, Any]]
     ) -> tuple[List[Dict[str, Any]], List[ToolMessage]]:
         """
-        Execute all tool calls in parallel and return results.
+        Execute tool calls concurrently (writes in order) and return results.
 
         Returns:
             tuple: (tool_calls_record, tool_messages)
                 - tool_calls_record: List of dicts tracking tool calls for next iteration
                 - tool_messages: List of ToolMessage objects to append to conversation
         """
-        logger.info(f"Tool calls requested: {len(tool_calls)}")
+        logger.debug("Tool calls requested: %d", len(tool_calls))
 
-        tool_calls_record = []
+        # Cap fan-out so a large batch of tool calls can't flood the DB pool
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
 
-        # Prepare all tool call coroutines for parallel execution
-        tool_coroutines = []
-        tool_metadata = []
+        async def _bounded(name: str, args: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self._execute_tool(name, args)
 
-        for tool_call in tool_calls:
-            tool_name = tool_call["name"]
-            tool_args = tool_call["args"]
-
-            logger.info(f"\nPreparing tool: {tool_name}")
-            logger.info(f"Arguments: {tool_args}")
+        # (name, args, call id) per tool call, in the order the LLM made them
+        tool_metadata = [
+            (tool_call["name"], tool_call["args"], tool_call["id"])
+            for tool_call in tool_calls
+        ]
+        logger.debug("Preparing tools: %s", tool_metadata)
+
+        # Writes run one at a time in the order the LLM issued them, so e.g. a
+        # create followed by a delete of the same event can't be reordered;
+        # everything else runs in parallel alongside them
+        write_indices = [
+            i
+            for i, (tool_name, _, _) in enumerate(tool_metadata)
+            if tool_name in _MUTATING_TOOLS
+        ]
+        other_indices = [
+            i
+            for i, (tool_name, _, _) in enumerate(tool_metadata)
+            if tool_name not in _MUTATING_TOOLS
+        ]
 
-            tool_coroutines.append(self._execute_tool(tool_name, tool_args))
-            tool_metadata.append(
-                {
-                    "tool_name": tool_name,
-                    "tool_args": tool_args,
-                    "tool_call_id": tool_call["id"],
-                }
-            )
+        async def _run_writes() -> List[Any]:
+            results: List[Any] = []
+            for i in write_indices:
+                tool_name, tool_args, _ = tool_metadata[i]
+                try:
+                    results.append(await _bounded(tool_name, dict(tool_args)))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        # Each tool gets its own copy of its args so concurrent tools never
+        # share a dict
+        tool_coroutines = [
+            _bounded(tool_metadata[i][0], dict(tool_metadata[i][1]))
+            for i in other_indices
+        ]
 
-        # Execute ALL tools in parallel
-        logger.info(
-            f"Executing {len(tool_coroutines)} tools in parallel using asyncio.gather..."
+        logger.debug(
+            "Executing %d tools in parallel, %d writes in order",
+            len(other_indices),
+            len(write_indices),
         )
-        tool_results = await asyncio.gather(*tool_coroutines)
-
-        # Process results
-        tool_messages = []
+        *other_results, write_results = await asyncio.gather(
+            *tool_coroutines, _run_writes(), return_exceptions=True
+        )
+        if isinstance(write_results, BaseException):
+            write_results = [write_results] * len(write_indices)
+
+        # Back into the order the LLM made the calls
+        tool_results: List[Any] = [None] * len(tool_metadata)
+        for i, tool_result in zip(other_indices, other_results):
+            tool_results[i] = tool_result
+        for i, tool_result in zip(write_indices, write_results):
+            tool_results[i] = tool_result
+
+        # A tool that raised past _execute_tool's own handling is reported to
+        # the LLM as an error instead of discarding the rest of the batch
         for i, tool_result in enumerate(tool_results):
-            meta = tool_metadata[i]
-            tool_name = meta["tool_name"]
-            tool_args = meta["tool_args"]
-            tool_call_id = meta["tool_call_id"]
-
-            logger.info(f"\n✓ Tool completed: {tool_name}")
-            logger.info(f"Result: {tool_result}")
+            if isinstance(tool_result, BaseException):
+                logger.error(
+                    "Tool %s failed: %r", tool_metadata[i][0], tool_result
+                )
+                tool_results[i] = {"error": str(tool_result)}
+
+        # Reads in the same batch as a write may have cached pre-write data
+        if any(tool_name in _MUTATING_TOOLS for tool_name, _, _ in tool_metadata):
+            self._turn_cache.clear()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Tools completed:\n%s",
+                "\n".join(
+                    f"  {tool_name}: {result}"
+                    for (tool_name, _, _), result in zip(tool_metadata, tool_results)
+                ),
+            )
 
-            # Track this tool call for next iteration
-            tool_calls_record.append(
-                {
-                    "tool_name": tool_name,
-                    "args": tool_args,
-                    "result": tool_result,
-                }
+        # Track these tool calls for next iteration. update_working_state has
+        # already persisted its state, and the prompt carries that state, so
+        # its echoed state_dict is left out of the record.
+        tool_calls_record = [
+            {
+                "tool_name": tool_name,
+                "args": tool_args,
+                "result": (
+                    {k: v for k, v in tool_result.items() if k != "state_dict"}
+                    if tool_name == "update_working_state"
+                    and isinstance(tool_result, dict)
+                    else tool_result
+                ),
+            }
+            for (tool_name, tool_args, _), tool_result in zip(
+                tool_metadata, tool_results
             )
+        ]
 
-            # Handle state update tool specially
-            if tool_name == "update_working_state":
-                if isinstance(tool_result, dict) and tool_result.get("success"):
-                    state_dict = tool_result.get("state_dict", {})
-                    if state_dict:
-                        conversation_service.update_conversation_state(
-                            self.user_id, state_dict
-                        )
-                        logger.info(
-                            f"✓ Conversation state updated from update_working_state tool"
-                        )
-
-            # Add tool result to messages
-            tool_messages.append(
-                ToolMessage(
-                    content=str(tool_result),
-                    tool_call_id=tool_call_id,
-                )
+        # Tool results for the transcript; the summary replaces each once stale
+        tool_messages = [
+            ToolMessage(
+                content=_compact_tool_result(tool_result),
+                tool_call_id=tool_call_id,
+                name=tool_name,
+                artifact=_summarize_tool_result(tool_name, tool_result),
+            )
+            for (tool_name, _, tool_call_id), tool_result in zip(
+                tool_metadata, tool_results
             )
+        ]
 
         return tool_calls_record, tool_messages
 
@@ -370,16 +750,22 @@ class ReactCalendarAgent:
             tool_name = tool_call["tool_name"]
             tool_result = tool_call["result"]
 
-            # Handle regular message tools
-            if isinstance(tool_result, dict) and "message_type" in tool_result:
+            # Handle regular message tools; only two tool names can be one,
+            # so every other tool skips the result inspection
+            if (
+                tool_name in _MESSAGE_TOOLS
+                and isinstance(tool_result, dict)
+                and "message_type" in tool_result
+            ):
                 message_content = tool_result.get("content", "")
-                logger.info(f"Message tool detected: {tool_name}")
-                logger.info(f"CHIKU: {message_content}")
+                logger.debug("Message tool detected: %s", tool_name)
+                logger.info("CHIKU: %s", message_content)
                 return message_content
 
             # Handle batch questions from decomposer
             if (
-                isinstance(tool_result, dict)
+                tool_name == "talk_to_decomposer_agent"
+                and isinstance(tool_result, dict)
                 and tool_result.get("awaiting_responses") is True
             ):
                 logger.info(
@@ -423,7 +809,7 @@ class ReactCalendarAgent:
         if hint:
             message += f"\n\n{hint}"
 
-        logger.info(f"CHIKU (batch Q1/{len(questions)}): {message}")
+        logger.info("CHIKU (batch Q1/%d): %s", len(questions), message)
         return message
 
     async def _continue_batch_question_collection(self, user_answer: str) -> str | None:
@@ -455,7 +841,10 @@ class ReactCalendarAgent:
 
         # Store the answer as-is (no validation - let decomposer interpret)
         logger.info(
-            f"✓ Answer {current_index + 1}/{len(questions)} collected: {user_answer[:50]}..."
+            "✓ Answer %d/%d collected: %.50s...",
+            current_index + 1,
+            len(questions),
+            user_answer,
         )
         answers.append({"question": question_text, "answer": user_answer})
 
@@ -465,7 +854,8 @@ class ReactCalendarAgent:
         if next_index >= len(questions):
             # All questions answered - complete batch collection
             logger.info(
-                f"✓ All {len(questions)} questions answered - completing batch collection"
+                "✓ All %d questions answered - completing batch collection",
+                len(questions),
             )
 
             # Keep decomposer state with all collected answers (don't clear!)
@@ -513,10 +903,16 @@ class ReactCalendarAgent:
         if next_hint:
             message += f"\n\n{next_hint}"
 
-        logger.info(f"CHIKU (batch Q{next_index + 1}/{len(questions)}): {message}")
+        logger.info(
+            "CHIKU (batch Q%d/%d): %s", next_index + 1, len(questions), message
+        )
         return message
 
-    async def chat(self, user_message: str) -> str:
+    async def chat(
+        self,
+        user_message: str,
+        stream_callback: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> str:
         """
         Process a user message using the ReAct loop with new architecture:
         - Enforces update_working_state as mandatory tool call
@@ -527,10 +923,15 @@ class ReactCalendarAgent:
         - Injects user response as the result of the previous message tool
         - Handles batch question collection from decomposer
 
+        If `stream_callback` is given, the reply text is passed to it in
+        pieces while the LLM writes it. It is per call because the agent is
+        shared by all of the user's connections.
+
         Returns the final message to send to the user.
         """
-        logger.info("=" * 80)
-        logger.info(f"USER: {user_message}")
+        logger.info("USER: %s", user_message)
+
+        await self._await_pending_save()
 
         # Check if we're in batch question collection mode
         current_state = conversation_service.get_conversation_state(self.user_id)
@@ -547,6 +948,21 @@ class ReactCalendarAgent:
                 return batch_result
             # else: fall through to normal processing below
             batch_just_completed = True
+        else:
+            # Answer pure small talk without spending an LLM round-trip
+            smalltalk_reply = self._smalltalk_reply(user_message, current_state)
+            if smalltalk_reply:
+                logger.info("Small talk detected - replying without the ReAct loop")
+                await conversation_service.save_messages(
+                    self.user_id,
+                    [("user", user_message), ("assistant", smalltalk_reply)],
+                )
+                return smalltalk_reply
+
+        # Route standalone lookups to the fast model
+        fast = not batch_active and self._is_simple_query(user_message, current_state)
+        if fast:
+            logger.info("Simple lookup - using fast model")
 
         # Inject user response into last message tool if applicable
         self._inject_user_response_into_last_message_tool(user_message)
@@ -564,21 +980,57 @@ class ReactCalendarAgent:
             HumanMessage(content=user_message),
         ]
 
+        # Cached reads never outlive the turn that made them
+        self._turn_cache.clear()
+
         # Set the user_id context for all tool executions
         context_token = set_current_user_id(self.user_id)
 
+        # On the session's first turn, load today's schedule while the LLM is
+        # thinking - it's the tool the first turn almost always asks for.
+        # Created after setting the context so the task sees the user_id.
+        if not self._prefetch_started:
+            self._prefetch_started = True
+            self._schedule_prefetch = asyncio.create_task(
+                get_todays_schedule.ainvoke({})
+            )
+
+        # Latest iteration's tool calls; written to the state once per turn
+        pending_tool_calls = None
+
         try:
             # ReAct loop - iterate until a message tool is called
             max_iterations = 10
             iteration = 0
             final_response = None
+            deadline = time.monotonic() + CHAT_TIME_BUDGET_SECONDS
 
             while iteration < max_iterations:
                 iteration += 1
-                logger.info(f"\n--- Iteration {iteration} ---")
+                logger.debug("--- Iteration %d ---", iteration)
+
+                # Stop before another LLM call once the turn is over budget
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        "Turn exceeded %.0fs budget after %d iterations",
+                        CHAT_TIME_BUDGET_SECONDS,
+                        iteration - 1,
+                    )
+                    final_response = "Sorry, that's taking me longer than it should. Could you try again in a moment?"
+                    await conversation_service.save_message(
+                        self.user_id, "assistant", final_response
+                    )
+                    break
 
                 # Borrow LLM from pool and invoke
-                response = await self._borrow_llm_and_invoke(messages, iteration)
+                response = await self._borrow_llm_and_invoke(
+                    self._trim_messages(messages),
+                    iteration,
+                    timeout=min(remaining, LLM_CALL_TIMEOUT_SECONDS),
+                    fast=fast,
+                    stream_callback=stream_callback,
+                )
 
                 if response is None:
                     # Error occurred during LLM invocation
@@ -595,7 +1047,8 @@ class ReactCalendarAgent:
                     # No tools called - LLM provided reasoning/response directly (ERROR STATE)
                     content = str(response.content) if response.content else ""
                     logger.warning(
-                        f"LLM responded without tool calls. This violates the protocol. Content: {content}"
+                        "LLM responded without tool calls. This violates the protocol. Content: %s",
+                        content,
                     )
 
                     # Force it to call at least the message tool
@@ -610,6 +1063,23 @@ class ReactCalendarAgent:
                 # Validate tool calls
                 self._validate_tool_calls(response.tool_calls)
 
+                # Don't start another batch of tools once the turn is over
+                # budget, unless the batch carries the reply itself
+                if time.monotonic() >= deadline and not any(
+                    tool_call["name"] in _MESSAGE_TOOLS
+                    for tool_call in response.tool_calls
+                ):
+                    logger.warning(
+                        "Turn exceeded %.0fs budget before running tools (iteration %d)",
+                        CHAT_TIME_BUDGET_SECONDS,
+                        iteration,
+                    )
+                    final_response = "Sorry, that's taking me longer than it should. Could you try again in a moment?"
+                    await conversation_service.save_message(
+                        self.user_id, "assistant", final_response
+                    )
+                    break
+
                 # Execute all tools in parallel
                 tool_calls_record, tool_messages = (
                     await self._execute_tools_in_parallel(response.tool_calls)
@@ -617,14 +1087,15 @@ class ReactCalendarAgent:
 
                 # Add tool messages to conversation
                 messages.extend(tool_messages)
+                if iteration > KEEP_FULL_TOOL_ITERATIONS:
+                    self._summarize_old_tool_messages(messages)
 
                 # Check if any tool was a message tool (end of iteration)
                 final_response = self._check_for_message_tool_result(tool_calls_record)
 
-                # Save tool calls record to state for next iteration
-                conversation_service.update_conversation_state(
-                    self.user_id, {"last_tool_calls": tool_calls_record}
-                )
+                # Nothing reads last_tool_calls until the next turn's prompt,
+                # so only the final iteration's record needs to be saved
+                pending_tool_calls = tool_calls_record
 
                 if final_response:
                     # Message tool was called - end iteration
@@ -632,93 +1103,146 @@ class ReactCalendarAgent:
                     if self.message_callback:
                         self.message_callback(final_response)
 
-                    # Save assistant message to history
-                    await conversation_service.save_message(
-                        self.user_id, "assistant", final_response
-                    )
+                    # Save assistant message to history off the response path
+                    self._save_reply_in_background(final_response)
 
-                    logger.info("=" * 80)
                     return final_response
 
             # Safety fallback if we hit max iterations
             if final_response is None:
-                logger.warning(f"Hit max iterations ({max_iterations})")
+                logger.warning("Hit max iterations (%d)", max_iterations)
                 final_response = "I apologize, but I'm having trouble processing your request. Could you please rephrase?"
                 await conversation_service.save_message(
                     self.user_id, "assistant", final_response
                 )
 
-            logger.info("=" * 80)
             return final_response
 
         finally:
+            # Save tool calls record to state for the next turn
+            if pending_tool_calls is not None:
+                conversation_service.update_conversation_field(
+                    self.user_id, "last_tool_calls", pending_tool_calls
+                )
+
             # Always reset the user_id context when done
             reset_current_user_id(context_token)
+            self._discard_schedule_prefetch()
+
+    def _save_reply_in_background(self, reply: str) -> None:
+        """Persist the assistant reply without holding up the response."""
+        task = asyncio.create_task(
+            conversation_service.save_message(self.user_id, "assistant", reply)
+        )
+        _background_saves.add(task)
+        task.add_done_callback(_on_background_save_done)
+        self._pending_save = task
+
+    async def _await_pending_save(self) -> None:
+        """Let the previous turn's reply land so history stays in order."""
+        task = self._pending_save
+        self._pending_save = None
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+
+    def _discard_schedule_prefetch(self) -> None:
+        """Drop an unused schedule prefetch so stale data never leaks into later turns."""
+        task = self._schedule_prefetch
+        self._schedule_prefetch = None
+        if task is None:
+            return
+        if task.done():
+            if not task.cancelled():
+                task.exception()  # Mark any failure as retrieved
+        else:
+            task.cancel()
+
+    async def _consume_schedule_prefetch(self) -> Optional[Any]:
+        """Return the prefetched schedule (once), or None if unavailable."""
+        task = self._schedule_prefetch
+        self._schedule_prefetch = None
+        if task is None:
+            return None
+        try:
+            return await task
+        except Exception as e:
+            logger.warning("Schedule prefetch failed, querying directly: %s", e)
+            return None
 
     async def _execute_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> Any:
         """Execute a tool by name with given arguments."""
-        tool_map = {
-            # State management
-            "update_working_state": update_working_state,
-            "reset_conversation_state": reset_conversation_state,
-            # Task decomposition
-            "talk_to_decomposer_agent": talk_to_decomposer_agent,
-            # Calendar query tools
-            "get_events": get_events,
-            "get_events_on_date": get_events_on_date,
-            "get_todays_schedule": get_todays_schedule,
-            "get_tomorrows_schedule": get_tomorrows_schedule,
-            "get_week_schedule": get_week_schedule,
-            "find_event_by_title": find_event_by_title,
-            # Availability tools
-            "find_available_slots": find_available_slots,
-            "check_time_availability": check_time_availability,
-            # Event management tools
-            "create_calendar_event": create_calendar_event,
-            "update_calendar_event": update_calendar_event,
-            "move_event_to_date": move_event_to_date,
-            "delete_calendar_event": delete_calendar_event,
-            # Reminder tools
-            "create_reminder": create_reminder,
-            "create_reminder_for_event": create_reminder_for_event,
-            "get_upcoming_reminders": get_upcoming_reminders,
-            "get_pending_reminders": get_pending_reminders,
-            "mark_reminder_completed": mark_reminder_completed,
-            "snooze_reminder": snooze_reminder,
-            "delete_reminder": delete_reminder,
-            # Message tools
-            "send_interrogative_message": send_interrogative_message,
-            "send_declarative_message": send_declarative_message,
-        }
-
-        tool = tool_map.get(tool_name)
-        if not tool:
-            return {"error": f"Unknown tool: {tool_name}"}
+        entry = _TOOL_MAP.get(tool_name)
+        if entry is None:
+            return _unknown_tool_error(tool_name)
+        tool, is_readonly = entry
+
+        cache_key = None
+        if is_readonly:
+            # Canonical JSON handles list and nested dict arguments alike
+            cache_key = (tool_name, to_json(tool_args, sort_keys=True))
+            if cache_key in self._turn_cache:
+                logger.debug("Reusing cached result for %s", tool_name)
+                return self._turn_cache[cache_key]
+
+        # A write this turn discards the prefetch, so only pre-write turns
+        # are served from it
+        if tool_name == "get_todays_schedule":
+            prefetched = await self._consume_schedule_prefetch()
+            if prefetched is not None:
+                self._turn_cache[cache_key] = prefetched
+                return prefetched
 
         try:
             result = await tool.ainvoke(tool_args)
-
-            # Add trace logging for decomposer interactions
-            if tool_name == "talk_to_decomposer_agent" and isinstance(result, dict):
-                result_type = result.get("type")
-                logger.info(f"🤖 Decomposer returned type: {result_type}")
-                if result_type == "batch_questions":
-                    logger.info(f"   Questions: {len(result.get('questions', []))}")
-                elif result_type == "final_plan":
-                    breakdown = result.get("breakdown", {})
-                    logger.info(f"   Subtasks: {len(breakdown.get('subtasks', []))}")
-
-            return result
         except Exception as e:
-            logger.error(f"Error executing tool {tool_name}: {e}", exc_info=True)
+            logger.error("Error executing tool %s: %s", tool_name, e, exc_info=True)
             return {"error": str(e)}
 
+        if is_readonly:
+            self._turn_cache[cache_key] = result
+        elif tool_name in _MUTATING_TOOLS:
+            self._invalidate_caches()
+
+        # Add trace logging for decomposer interactions
+        if tool_name == "talk_to_decomposer_agent" and isinstance(result, dict):
+            result_type = result.get("type")
+            logger.info("🤖 Decomposer returned type: %s", result_type)
+            if result_type == "batch_questions":
+                logger.info("   Questions: %d", len(result.get("questions", [])))
+            elif result_type == "final_plan":
+                breakdown = result.get("breakdown", {})
+                logger.info("   Subtasks: %d", len(breakdown.get("subtasks", [])))
+
+        return result
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached reads after the user's data changed."""
+        self._turn_cache.clear()
+        # The prefetched schedule predates the write; later reads must query
+        self._discard_schedule_prefetch()
+
     def reset_conversation(self):
         """Reset the conversation state and history."""
         conversation_service.reset_conversation_state(self.user_id)
+        self._invalidate_caches()
         logger.info("Conversation state reset")
 
 
+# Agents are reused per user; past this many the least recently used is
+# dropped (its conversation state lives in conversation_service)
+MAX_CACHED_AGENTS = 1000
+_agents: "OrderedDict[str, ReactCalendarAgent]" = OrderedDict()
+
+
 def create_react_agent(user_id: str) -> ReactCalendarAgent:
-    """Factory function to create a ReAct agent."""
-    return ReactCalendarAgent(user_id)
+    """Return the user's ReAct agent, creating it on first use."""
+    agent = _agents.get(user_id)
+    if agent is not None:
+        _agents.move_to_end(user_id)
+        return agent
+
+    agent = ReactCalendarAgent(user_id)
+    _agents[user_id] = agent
+    while len(_agents) > MAX_CACHED_AGENTS:
+        _agents.popitem(last=False)
+    return agent
@@ -24,6 +24,9 @@ if not OPENAI_MODEL:
     raise ValueError("OPENAI_MODEL must be set in .env file")
 OPENAI_MODEL = OPENAI_MODEL.strip()
 
+# Smaller, faster model for simple lookup turns (optional)
+OPENAI_FAST_MODEL = os.getenv("OPENAI_FAST_MODEL", "gpt-4o-mini").strip()
+
 # ============================================================================
 # MongoDB Configuration
 # ============================================================================
@@ -58,3 +61,11 @@ if not LOCK_EXPIRY:
 
 LOCK_EXPIRY = int(LOCK_EXPIRY)  # Ensure it's an integer
 LOCK_EXPIRY_FLOAT = float(LOCK_EXPIRY)  # For backward compatibility
+
+# ============================================================================
+# Agent Configuration
+# ============================================================================
+# Upper bound on tool calls executed concurrently within one ReAct iteration
+TOOL_CONCURRENCY = int(os.getenv("TOOL_CONCURRENCY", "8"))
+if TOOL_CONCURRENCY < 1:
+    raise ValueError("TOOL_CONCURRENCY must be at least 1")
@@ -8,19 +8,20 @@ from fastapi import (
 )
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Dict, List
+from typing import List
 import json
 import logging
 
 from app.utils.mongo_client import init_db
+from app.utils.logging_util import configure_logging
 from app.services.mongo_calendar_service import MongoCalendarService
-from app.services.conversation_service import ConversationService
+from app.services.conversation_service import conversation_service
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+configure_logging(
+    level=logging.INFO, fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
 app = FastAPI(title="Calendar Assistant (Chiku - ReAct)", version="0.2.0")
@@ -37,10 +38,8 @@ app.add_middleware(
 # Create API router with /api prefix
 api_router = APIRouter(prefix="/api")
 
-# Store agent instances per user
 # Initialize calendar service
 calendar_service = MongoCalendarService()
-conversation_service = ConversationService()
 
 
 @app.on_event("startup")
@@ -57,9 +56,13 @@ async def startup_event():
         )
 
 
-from app.agents.react.react_agent import create_react_agent, ReactCalendarAgent
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Finish saving replies that were written in the background."""
+    await drain_background_saves()
 
-user_agents: Dict[str, ReactCalendarAgent] = {}
+
+from app.agents.react.react_agent import create_react_agent, drain_background_saves
 
 
 class ChatMessage(BaseModel):
@@ -94,6 +97,8 @@ class CalendarEventsResponse(BaseModel):
     end_date: str
     events: List[CalendarEventResponse]
     total: int
+    # True when the range held more events than were returned
+    truncated: bool = False
 
 
 class ReminderResponse(BaseModel):
@@ -147,18 +152,7 @@ async def chat(msg: ChatMessage):
     WebSocket endpoint is recommended for better real-time interaction.
     """
     # Get or create agent for this user
-    # Ensure we recreate the agent if the user_id doesn't match (prevents stale agent reuse)
-    if (
-        msg.user_id not in user_agents
-        or user_agents[msg.user_id].user_id != msg.user_id
-    ):
-        if msg.user_id in user_agents:
-            logger.warning(
-                f"Recreating agent for {msg.user_id} - user_id mismatch detected"
-            )
-        user_agents[msg.user_id] = create_react_agent(msg.user_id)
-
-    agent = user_agents[msg.user_id]
+    agent = create_react_agent(msg.user_id)
 
     # Process message
     response_text = await agent.chat(msg.text)
@@ -185,7 +179,7 @@ async def get_events_range(
     """
     try:
         # Fetch events from the database
-        events = await calendar_service.get_events_by_date_range(
+        events, truncated = await calendar_service.search_events(
             user_id=user_id, start_date=start_date, end_date=end_date
         )
 
@@ -212,6 +206,7 @@ async def get_events_range(
             end_date=end_date,
             events=event_responses,
             total=len(event_responses),
+            truncated=truncated,
         )
 
     except ValueError as e:
@@ -322,21 +317,21 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
     {"type": "message", "text": "user message here"}
 
     Response format (to client):
+    {"type": "delta", "text": "next piece of the reply"}  (zero or more)
     {"type": "response", "text": "assistant response"}
+
+    Delta frames stream the reply while it is generated; the response frame
+    always carries the complete final text and supersedes any deltas.
     """
     await websocket.accept()
     logger.info(f"🔗 WebSocket connection established for user: {user_id}")
 
     # Get or create agent for this user
-    # Ensure we recreate the agent if the user_id doesn't match (prevents stale agent reuse)
-    if user_id not in user_agents or user_agents[user_id].user_id != user_id:
-        if user_id in user_agents:
-            logger.warning(
-                f"Recreating agent for {user_id} - user_id mismatch detected"
-            )
-        user_agents[user_id] = create_react_agent(user_id)
+    agent = create_react_agent(user_id)
 
-    agent = user_agents[user_id]
+    # Forward the reply text to the client as the LLM writes it
+    async def send_delta(text: str) -> None:
+        await websocket.send_json({"type": "delta", "text": text})
 
     try:
         # Send welcome message
@@ -360,7 +355,9 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
                 logger.info("*" * 80)
 
                 # Process with ReAct agent
-                response_text = await agent.chat(user_message)
+                response_text = await agent.chat(
+                    user_message, stream_callback=send_delta
+                )
 
                 # Send response back to client
                 logger.info(f"📤 Sending response to user: {response_text}")
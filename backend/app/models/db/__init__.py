@@ -1,4 +1,4 @@
-from .calendar_event import CalendarEvent
+from .calendar_event import CalendarEvent, CalendarEventView
 from .reminder import Reminder
 
-__all__ = ["CalendarEvent", "Reminder"]
+__all__ = ["CalendarEvent", "CalendarEventView", "Reminder"]
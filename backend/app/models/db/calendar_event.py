@@ -4,8 +4,18 @@ Calendar Event Beanie Document Model
 
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from beanie import Document
-from pydantic import Field, computed_field
+from beanie import (
+    Document,
+    Insert,
+    PydanticObjectId,
+    Replace,
+    Save,
+    SaveChanges,
+    before_event,
+)
+from pydantic import BaseModel, Field, computed_field
+
+_MST = timezone(timedelta(hours=-7))
 
 
 class CalendarEvent(Document):
@@ -14,6 +24,8 @@ class CalendarEvent(Document):
     user_id: str
     title: str
     event_datetime: datetime  # Full datetime of the event
+    # event_datetime + duration, stored so overlap checks are a range query
+    end_datetime: Optional[datetime] = None
     duration: int  # minutes
     description: Optional[str] = None
     title_embedding: Optional[list[float]] = (
@@ -22,6 +34,11 @@ class CalendarEvent(Document):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    @before_event(Insert, Replace, Save, SaveChanges)
+    def sync_end_datetime(self) -> None:
+        """Derive end_datetime from the start and duration on every write."""
+        self.end_datetime = self.event_datetime + timedelta(minutes=self.duration)
+
     @computed_field
     @property
     def date(self) -> str:
@@ -33,23 +50,21 @@ class CalendarEvent(Document):
         wall-clock day and time.
         """
 
-        mst_offset = timezone(timedelta(hours=-7))
-        mst_dt = self.event_datetime.astimezone(mst_offset)
-        return mst_dt.strftime("%Y-%m-%d")
+        return self.event_datetime.astimezone(_MST).strftime("%Y-%m-%d")
 
     @computed_field
     @property
     def start_time(self) -> str:
         """Return local (MST, UTC-7) time in HH:MM format."""
 
-        mst_offset = timezone(timedelta(hours=-7))
-        mst_dt = self.event_datetime.astimezone(mst_offset)
-        return mst_dt.strftime("%H:%M")
+        return self.event_datetime.astimezone(_MST).strftime("%H:%M")
 
     class Settings:
         name = "events"  # Collection name
         indexes = [
-            [("user_id", 1), ("event_datetime", 1)],
+            # Serves range reads on event_datetime and the start/end overlap
+            # check in is_time_available
+            [("user_id", 1), ("event_datetime", 1), ("end_datetime", 1)],
         ]
 
     class Config:
@@ -62,3 +77,34 @@ class CalendarEvent(Document):
                 "description": "Weekly team sync-up",
             }
         }
+
+
+class CalendarEventView(BaseModel):
+    """
+    Read projection of CalendarEvent without `title_embedding`.
+
+    The 384-float embedding dominates document size but is never needed when
+    listing events, so range reads project it away on the server.
+    """
+
+    id: PydanticObjectId = Field(alias="_id")
+    user_id: str
+    title: str
+    event_datetime: datetime
+    end_datetime: Optional[datetime] = None
+    duration: int
+    description: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    @computed_field
+    @property
+    def date(self) -> str:
+        """Return local (MST, UTC-7) date in YYYY-MM-DD format."""
+        return self.event_datetime.astimezone(_MST).strftime("%Y-%m-%d")
+
+    @computed_field
+    @property
+    def start_time(self) -> str:
+        """Return local (MST, UTC-7) time in HH:MM format."""
+        return self.event_datetime.astimezone(_MST).strftime("%H:%M")
@@ -27,7 +27,9 @@ class Reminder(Document):
         name = "reminders"  # Collection name
         indexes = [
             [("user_id", 1), ("reminder_datetime", 1)],
-            [("user_id", 1), ("status", 1)],
+            # Equality on status, then range/sort on time: serves both the
+            # upcoming and pending reminder queries without an in-memory sort
+            [("user_id", 1), ("status", 1), ("reminder_datetime", 1)],
         ]
 
     class Config:
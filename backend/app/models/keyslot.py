@@ -45,8 +45,8 @@ class KeySlot:
         keys = redis.keys(pattern)
         if not keys:
             return 0
-        # Fetch all values in parallel
-        vals = [redis.get(k) for k in keys]  # type: ignore
+        # Fetch all values in one round-trip
+        vals = redis.mget(keys)  # type: ignore
         return sum(int(v) for v in vals if v is not None and v != "")  # type: ignore
 
     def record_usage(self, tokens_used: int) -> None:
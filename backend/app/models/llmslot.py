@@ -13,6 +13,9 @@ from .keyslot import KeySlot
 
 logger = logging.getLogger(__name__)
 
+# Suggested retry delay in OpenAI rate-limit error messages
+_RETRY_AFTER = re.compile(r"Please try again in ([\d.]+)s")
+
 
 class LLMSlot:
     """
@@ -24,11 +27,13 @@ class LLMSlot:
         self,
         key_slot: KeySlot,
         model_name: str,
+        fast_model_name: str,
     ):
         self.key_slot = key_slot
         self.name = key_slot.name
         self.api_key = key_slot.api_key
         self.model_name = model_name
+        self.fast_model_name = fast_model_name
 
         # Initialize the LLM instance (LLM-specific)
         self._initialize_llm()
@@ -43,8 +48,15 @@ class LLMSlot:
             api_key=SecretStr(self.api_key),
             temperature=0.7,
         )
+        # Same key, smaller model - used for simple lookup turns
+        self.fast_llm = ChatOpenAI(
+            model=self.fast_model_name,
+            api_key=SecretStr(self.api_key),
+            temperature=0.7,
+        )
         logger.debug(
             f"Initialized LLM for slot '{self.name}' with model '{self.model_name}'"
+            f" (fast: '{self.fast_model_name}')"
         )
 
     # Delegate all KeySlot methods
@@ -149,7 +161,7 @@ class LLMSlot:
                 "rate limit reached" in error_msg.lower()
                 or "rate_limit_exceeded" in error_msg
             ):
-                match = re.search(r"Please try again in ([\d.]+)s", error_msg)
+                match = _RETRY_AFTER.search(error_msg)
                 if match:
                     delay = float(match.group(1))
                     logger.warning(
@@ -3,7 +3,8 @@ Service for managing conversation messages and state.
 Stores message history in MongoDB and manages in-memory conversation state.
 """
 
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 import logging
 from pydantic import BaseModel, Field
@@ -11,6 +12,9 @@ from bson import ObjectId
 
 logger = logging.getLogger(__name__)
 
+# Number of rendered "role: content" lines kept in memory per user
+RENDERED_HISTORY_SIZE = 20
+
 
 class Message(BaseModel):
     """Represents a conversation message."""
@@ -61,39 +65,63 @@ class ConversationService:
         """Initialize conversation service."""
         # In-memory conversation states (user_id -> ConversationState)
         self.conversation_states: Dict[str, ConversationState] = {}
+        # Recent messages already rendered for the prompt (user_id -> lines),
+        # oldest first; filled from MongoDB on first use, extended by every
+        # save, and dropped when messages are marked old
+        self._rendered_history: Dict[str, deque] = {}
+
+    def _current_session_id(self, user_id: str) -> str:
+        """Get the user's session_id, creating one on their first message ever."""
+        current_state = self.get_conversation_state(user_id)
+        if not current_state.session_id:
+            current_state.session_id = str(ObjectId())
+            self.conversation_states[user_id] = current_state
+        return current_state.session_id
 
     async def save_message(self, user_id: str, role: str, content: str) -> Message:
         """Save a message to the conversation history."""
+        return (await self.save_messages(user_id, [(role, content)]))[0]
+
+    async def save_messages(
+        self, user_id: str, entries: List[tuple[str, str]]
+    ) -> List[Message]:
+        """
+        Save several (role, content) messages in one round-trip.
+
+        Timestamps step by a millisecond (BSON datetime precision) so the
+        messages keep their order when read back sorted by created_at.
+        """
         from app.utils.mongo_client import get_mongo_database
 
         db = await get_mongo_database()
         messages = db.messages
 
-        # Get current session_id from conversation state
-        current_state = self.get_conversation_state(user_id)
-        session_id = current_state.session_id
-
-        # If no session_id exists, create one (first message ever)
-        if not session_id:
-            session_id = str(ObjectId())
-            current_state.session_id = session_id
-            self.conversation_states[user_id] = current_state
+        session_id = self._current_session_id(user_id)
 
         now = datetime.now()
-        message_dict = {
-            "user_id": user_id,
-            "session_id": session_id,
-            "created_at": now,
-            "updated_at": now,
-            "role": role,
-            "content": content,
-            "is_old": False,
-        }
-
-        result = await messages.insert_one(message_dict)
-        message_dict["_id"] = str(result.inserted_id)
-
-        return Message(**message_dict)
+        message_dicts = [
+            {
+                "user_id": user_id,
+                "session_id": session_id,
+                "created_at": now + timedelta(milliseconds=i),
+                "updated_at": now + timedelta(milliseconds=i),
+                "role": role,
+                "content": content,
+                "is_old": False,
+            }
+            for i, (role, content) in enumerate(entries)
+        ]
+
+        result = await messages.insert_many(message_dicts)
+        for message_dict, inserted_id in zip(message_dicts, result.inserted_ids):
+            message_dict["_id"] = str(inserted_id)
+
+        # Keep the rendered history in step with what was just inserted
+        history = self._rendered_history.get(user_id)
+        if history is not None:
+            history.extend(f"{role}: {content}" for role, content in entries)
+
+        return [Message(**message_dict) for message_dict in message_dicts]
 
     async def get_recent_messages(self, user_id: str, limit: int = 5) -> List[Message]:
         """Get the most recent messages for a user that are not marked as old."""
@@ -126,6 +154,16 @@ class ConversationService:
             self.conversation_states[user_id] = ConversationState()
         return self.conversation_states[user_id]
 
+    def get_conversation_state_json(self, user_id: str) -> str:
+        """
+        Get the conversation state as indented JSON for the prompt.
+
+        Excludes last_tool_calls, which the prompt formats separately.
+        """
+        return self.get_conversation_state(user_id).model_dump_json(
+            indent=2, exclude={"last_tool_calls"}
+        )
+
     def get_conversation_state_for_prompt(self, user_id: str) -> Dict[str, Any]:
         """
         Get conversation state as dict for prompt inclusion.
@@ -149,14 +187,29 @@ class ConversationService:
 
         # Deep merge the partial update
         state_dict = self._deep_merge(state_dict, partial_update)
-        logger.info(
-            f"[CONVERSATION SERVICE] Updated state for user {user_id}: final state\n{state_dict}"
+        logger.debug(
+            "[CONVERSATION SERVICE] Updated state for user %s: final state\n%s",
+            user_id,
+            state_dict,
         )
 
         # Update the in-memory state
         self.conversation_states[user_id] = ConversationState(**state_dict)
         return self.conversation_states[user_id]
 
+    def update_conversation_field(
+        self, user_id: str, field: str, value: Any
+    ) -> ConversationState:
+        """
+        Replace a single top-level state field in place.
+
+        For values that are always overwritten whole (e.g. last_tool_calls),
+        this skips the dump/deep-merge/rebuild of update_conversation_state.
+        """
+        current_state = self.get_conversation_state(user_id)
+        setattr(current_state, field, value)
+        return current_state
+
     def reset_conversation_state(self, user_id: str) -> None:
         """Reset the conversation state for a user."""
         self.conversation_states[user_id] = ConversationState()
@@ -208,6 +261,8 @@ class ConversationService:
             {"user_id": user_id, "session_id": session_id, "is_old": False},
             {"$set": {"is_old": True, "updated_at": datetime.now()}},
         )
+        # Reload on next use rather than guess which lines are still current
+        self._rendered_history.pop(user_id, None)
 
         return result.modified_count
 
@@ -233,17 +288,33 @@ class ConversationService:
         return result
 
     async def format_recent_messages(self, user_id: str, limit: int = 5) -> str:
-        """Format recent messages as a string for prompt inclusion."""
-        messages = await self.get_recent_messages(user_id, limit)
+        """
+        Format recent messages as a string for prompt inclusion.
 
-        if not messages:
+        Rendered lines are kept per user and extended by save_messages, so
+        MongoDB is only queried the first time (or after messages are marked
+        old) instead of on every turn.
+        """
+        if limit > RENDERED_HISTORY_SIZE:
+            messages = await self.get_recent_messages(user_id, limit)
+            lines = [f"{msg.role}: {msg.content}" for msg in messages]
+        else:
+            history = self._rendered_history.get(user_id)
+            if history is None:
+                messages = await self.get_recent_messages(
+                    user_id, RENDERED_HISTORY_SIZE
+                )
+                history = deque(
+                    (f"{msg.role}: {msg.content}" for msg in messages),
+                    maxlen=RENDERED_HISTORY_SIZE,
+                )
+                self._rendered_history[user_id] = history
+            lines = list(history)[-limit:]
+
+        if not lines:
             return "No previous messages."
 
-        formatted = []
-        for msg in messages:
-            formatted.append(f"{msg.role}: {msg.content}")
-
-        return "\n".join(formatted)
+        return "\n".join(lines)
 
 
 # Global instance
@@ -1,12 +1,47 @@
 """\nCalendar service using Beanie ODM for MongoDB operations.\nProvides semantic calendar and reminder management.\n\nAll event datetimes are stored in UTC. Incoming date/time values from tools\n(e.g. "2025-11-15" + "17:30") are interpreted as **local MST (UTC-7)** and\nconverted to UTC before persistence so that the frontend, which renders in MST,\nshows the correct wall-clock time.\n"""
 
+import asyncio
+import re
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
-from beanie import PydanticObjectId
+from typing import Any, Dict, List, Optional, Tuple
+from beanie import PydanticObjectId, UpdateResponse
 
-from app.models.db.calendar_event import CalendarEvent
+from app.models.db.calendar_event import CalendarEvent, CalendarEventView
 from app.models.db.reminder import Reminder
 from app.utils.embedding_util import generate_embedding
+from app.utils.cache_util import UserTTLCache
+
+# Upper bound on events returned by one range read, and the cursor batch size
+MAX_EVENTS_PER_READ = 500
+EVENT_READ_BATCH_SIZE = 100
+
+# Longest event accepted; bounds how far back the overlap query looks for
+# events that could still be running at a given time
+MAX_EVENT_DURATION_MINUTES = 7 * 24 * 60
+
+# Read-through caches for event and reminder reads, shared by every service
+# instance (the REST API and the agent tools use separate instances). Each
+# write drops the affected user's entries. They are per process, so the TTL
+# only spans a burst of reads (one agent turn plus the UI refresh after it);
+# results are stored as tuples and callers get fresh lists.
+READ_CACHE_TTL_SECONDS = 5.0
+_event_reads = UserTTLCache(ttl=READ_CACHE_TTL_SECONDS)
+_reminder_reads = UserTTLCache(ttl=READ_CACHE_TTL_SECONDS)
+
+
+def _mst_day_start_utc(date: str) -> datetime:
+    """Return the UTC instant at which an MST (UTC-7) calendar day begins."""
+    mst_offset = timezone(timedelta(hours=-7))
+    day_start_mst = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=mst_offset)
+    return day_start_mst.astimezone(timezone.utc)
+
+
+def _check_duration(duration: int) -> None:
+    """Reject durations the overlap query in is_time_available can't see."""
+    if not 0 <= duration <= MAX_EVENT_DURATION_MINUTES:
+        raise ValueError(
+            f"Event duration must be between 0 and {MAX_EVENT_DURATION_MINUTES} minutes"
+        )
 
 
 class MongoCalendarService:
@@ -30,6 +65,7 @@ class MongoCalendarService:
         to UTC before storing so that all `event_datetime` values in MongoDB
         are timezone-consistent.
         """
+        _check_duration(duration)
 
         # 1) Parse naive local datetime (as provided by tools / agent)
         local_naive = datetime.strptime(f"{date} {start_time}", "%Y-%m-%d %H:%M")
@@ -39,8 +75,9 @@ class MongoCalendarService:
         local_mst = local_naive.replace(tzinfo=mst_offset)
         event_datetime_utc = local_mst.astimezone(timezone.utc)
 
-        # Generate embedding for semantic search
-        title_embedding = generate_embedding(title)
+        # Generate embedding for semantic search. Model inference is CPU-bound,
+        # so run it in a worker thread instead of stalling the event loop.
+        title_embedding = await asyncio.to_thread(generate_embedding, title)
 
         event = CalendarEvent(
             user_id=user_id,
@@ -51,6 +88,7 @@ class MongoCalendarService:
             title_embedding=title_embedding,
         )
         await event.insert()
+        _event_reads.invalidate(user_id)
         return event
 
     async def get_user_events(self, user_id: str) -> List[CalendarEvent]:
@@ -59,45 +97,119 @@ class MongoCalendarService:
         return events
 
     async def get_events_by_date_range(
-        self, user_id: str, start_date: str, end_date: Optional[str] = None
-    ) -> List[CalendarEvent]:
+        self,
+        user_id: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        limit: int = MAX_EVENTS_PER_READ,
+    ) -> List[CalendarEventView]:
         """
         Get events for a user within a date range.
 
+        At most `limit` events (earliest first) are returned; callers that
+        may hit the cap and need to know should use search_events.
+        """
+        events, _ = await self.search_events(user_id, start_date, end_date, limit=limit)
+        return events
+
+    async def search_events(
+        self,
+        user_id: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        title_query: Optional[str] = None,
+        limit: int = MAX_EVENTS_PER_READ,
+    ) -> Tuple[List[CalendarEventView], bool]:
+        """
+        Get events in a date range, optionally filtered by title on the server.
+
         The date strings (e.g. "2025-11-15") are interpreted as MST calendar days.
-        We convert them to UTC boundaries for querying the database, ensuring that
-        events stored in UTC are correctly matched to their MST calendar day.
+        We convert them to a half-open UTC range [start day, day after end day)
+        so the (user_id, event_datetime) index serves the query and nothing in
+        the last second of the day slips through. `title_query` is a
+        case-insensitive substring match.
+
+        Returns:
+            (events, truncated): at most `limit` events, earliest first, and
+            whether more matched than were returned
         """
         if not end_date:
             end_date = start_date
 
-        # Define MST timezone (UTC-7)
-        mst_offset = timezone(timedelta(hours=-7))
+        start_dt_utc = _mst_day_start_utc(start_date)
+        end_dt_utc = _mst_day_start_utc(end_date) + timedelta(days=1)
+
+        query: Dict[str, Any] = {
+            "user_id": user_id,
+            "event_datetime": {"$gte": start_dt_utc, "$lt": end_dt_utc},
+        }
+        if title_query:
+            query["title"] = {"$regex": re.escape(title_query), "$options": "i"}
 
-        # Parse dates as MST start/end of day
-        start_dt_naive = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt_naive = datetime.strptime(end_date, "%Y-%m-%d").replace(
-            hour=23, minute=59, second=59
+        # One extra document tells us whether the cap cut anything off
+        events = (
+            await CalendarEvent.find(query, batch_size=EVENT_READ_BATCH_SIZE)
+            .sort("event_datetime")
+            .limit(limit + 1)
+            .project(CalendarEventView)
+            .to_list()
         )
 
-        # Make them timezone-aware in MST, then convert to UTC for DB query
-        start_dt_mst = start_dt_naive.replace(tzinfo=mst_offset)
-        end_dt_mst = end_dt_naive.replace(tzinfo=mst_offset)
+        truncated = len(events) > limit
+        if truncated:
+            del events[limit:]
+        return events, truncated
+
+    async def get_events_by_dates(
+        self, user_id: str, dates: List[str]
+    ) -> Dict[str, List[CalendarEventView]]:
+        """
+        Get events for several (not necessarily contiguous) MST dates at once.
+
+        Issues a single query with one UTC day range per date and buckets the
+        results by their MST `date`. Every requested date is present in the
+        returned dict, with an empty list when it has no events.
+        """
+        cache_key = ("dates", tuple(dates))
+        cached = _event_reads.get(user_id, cache_key)
+        if cached is not None:
+            return {date: list(events) for date, events in cached.items()}
+
+        day_ranges = []
+        for date in dates:
+            day_start = _mst_day_start_utc(date)
+            day_ranges.append(
+                {
+                    "event_datetime": {
+                        "$gte": day_start,
+                        "$lt": day_start + timedelta(days=1),
+                    }
+                }
+            )
 
-        start_dt_utc = start_dt_mst.astimezone(timezone.utc)
-        end_dt_utc = end_dt_mst.astimezone(timezone.utc)
+        schedule: Dict[str, List[CalendarEventView]] = {date: [] for date in dates}
+        if not day_ranges:
+            return schedule
 
         events = (
             await CalendarEvent.find(
-                CalendarEvent.user_id == user_id,
-                CalendarEvent.event_datetime >= start_dt_utc,
-                CalendarEvent.event_datetime <= end_dt_utc,
+                {"user_id": user_id, "$or": day_ranges},
+                batch_size=EVENT_READ_BATCH_SIZE,
             )
             .sort("event_datetime")
+            .limit(MAX_EVENTS_PER_READ)
+            .project(CalendarEventView)
             .to_list()
         )
+        for event in events:
+            schedule.setdefault(event.date, []).append(event)
 
-        return events
+        _event_reads.set(
+            user_id,
+            cache_key,
+            {date: tuple(day_events) for date, day_events in schedule.items()},
+        )
+        return schedule
 
     async def get_event(self, user_id: str, event_id: str) -> Optional[CalendarEvent]:
         """Get a specific event."""
@@ -119,21 +231,35 @@ class MongoCalendarService:
         duration: Optional[int] = None,
         description: Optional[str] = None,
     ) -> Optional[CalendarEvent]:
-        """Update an existing event."""
+        """
+        Update an existing event.
+
+        Applied with a single find-and-modify that returns the updated event.
+        The stored event is read first only when the new start or end can't
+        be computed from the arguments alone (one of date/start_time changes,
+        or duration changes without a new start).
+        """
+        if duration is not None:
+            _check_duration(duration)
+
         try:
-            event = await CalendarEvent.get(PydanticObjectId(event_id))
-            if not event or event.user_id != user_id:
-                return None
+            object_id = PydanticObjectId(event_id)
 
             update_data: Dict[str, Any] = {"updated_at": datetime.utcnow()}
 
             # If date or start_time is being updated, recompute event_datetime.
             # Input date/time are interpreted as local MST (UTC-7) and then
             # converted to UTC for storage, matching create_event behaviour.
+            event = None
             if date is not None or start_time is not None:
-                # Use existing values if not updating
-                current_date = date if date else event.date
-                current_time = start_time if start_time else event.start_time
+                current_date, current_time = date, start_time
+                if not (current_date and current_time):
+                    # Use existing values for the half not being updated
+                    event = await self.get_event(user_id, event_id)
+                    if not event:
+                        return None
+                    current_date = current_date or event.date
+                    current_time = current_time or event.start_time
 
                 local_naive = datetime.strptime(
                     f"{current_date} {current_time}", "%Y-%m-%d %H:%M"
@@ -147,26 +273,53 @@ class MongoCalendarService:
                 update_data["title"] = title
             if duration is not None:
                 update_data["duration"] = duration
+
+            # Keep the denormalized end_datetime in step with start/duration
+            if "event_datetime" in update_data or duration is not None:
+                new_start = update_data.get("event_datetime")
+                new_duration = duration
+                if new_start is None or new_duration is None:
+                    if event is None:
+                        event = await self.get_event(user_id, event_id)
+                        if not event:
+                            return None
+                    if new_start is None:
+                        new_start = event.event_datetime
+                    if new_duration is None:
+                        new_duration = event.duration
+                update_data["end_datetime"] = new_start + timedelta(
+                    minutes=new_duration
+                )
             if description is not None:
                 update_data["description"] = description
 
-            await event.set(update_data)
+            event = await CalendarEvent.find_one(
+                CalendarEvent.id == object_id,
+                CalendarEvent.user_id == user_id,
+            ).update(
+                {"$set": update_data},
+                response_type=UpdateResponse.NEW_DOCUMENT,
+            )
+            _event_reads.invalidate(user_id)
             return event
         except Exception:
             return None
 
     async def delete_event(self, user_id: str, event_id: str) -> bool:
-        """Delete an event."""
+        """Delete an event (single round-trip, scoped to the owner)."""
         try:
-            event = await CalendarEvent.get(PydanticObjectId(event_id))
-            if event and event.user_id == user_id:
-                await event.delete()
-                return True
-            return False
+            result = await CalendarEvent.find_one(
+                CalendarEvent.id == PydanticObjectId(event_id),
+                CalendarEvent.user_id == user_id,
+            ).delete()
+            _event_reads.invalidate(user_id)
+            return bool(result and result.deleted_count)
         except Exception:
             return False
 
-    async def get_events_on_date(self, user_id: str, date: str) -> List[CalendarEvent]:
+    async def get_events_on_date(
+        self, user_id: str, date: str
+    ) -> List[CalendarEventView]:
         """Get all events for a specific date."""
         return await self.get_events_by_date_range(user_id, date, date)
 
@@ -202,6 +355,9 @@ class MongoCalendarService:
         current_time = work_start
 
         for busy_start, busy_end in busy_periods:
+            # Later events can't open a gap inside the work day
+            if busy_start >= work_end:
+                break
             if busy_start - current_time >= duration_minutes:
                 # Found a gap
                 available_slots.append(
@@ -228,25 +384,30 @@ class MongoCalendarService:
     async def is_time_available(
         self, user_id: str, date: str, start_time: str, duration: int
     ) -> bool:
-        """Check if a specific time slot is available."""
-        events = await self.get_events_on_date(user_id, date)
-
-        # Parse proposed time
-        proposed_hour, proposed_min = map(int, start_time.split(":"))
-        proposed_start = proposed_hour * 60 + proposed_min
-        proposed_end = proposed_start + duration
-
-        # Check for conflicts
-        for event in events:
-            event_hour, event_min = map(int, event.start_time.split(":"))
-            event_start = event_hour * 60 + event_min
-            event_end = event_start + event.duration
-
-            # Check if times overlap
-            if not (proposed_end <= event_start or proposed_start >= event_end):
-                return False
+        """
+        Check if a specific time slot is available.
 
-        return True
+        A single indexed overlap query on the stored start/end datetimes:
+        any event starting before the slot ends and ending after it starts
+        is a conflict. This also catches events that run over from the
+        previous day. The lower bound on the start (no event is longer than
+        MAX_EVENT_DURATION_MINUTES) keeps the index scan to that window.
+        """
+        local_mst = datetime.strptime(
+            f"{date} {start_time}", "%Y-%m-%d %H:%M"
+        ).replace(tzinfo=timezone(timedelta(hours=-7)))
+        proposed_start = local_mst.astimezone(timezone.utc)
+        proposed_end = proposed_start + timedelta(minutes=duration)
+
+        earliest_start = proposed_start - timedelta(minutes=MAX_EVENT_DURATION_MINUTES)
+        conflict = await CalendarEvent.find_one(
+            CalendarEvent.user_id == user_id,
+            CalendarEvent.event_datetime >= earliest_start,
+            CalendarEvent.event_datetime < proposed_end,
+            CalendarEvent.end_datetime > proposed_start,
+        ).project(CalendarEventView)
+
+        return conflict is None
 
     # ================== REMINDER METHODS ==================
 
@@ -274,6 +435,7 @@ class MongoCalendarService:
             notes=notes,
         )
         await reminder.insert()
+        _reminder_reads.invalidate(user_id)
         return reminder
 
     async def create_reminder_for_event(
@@ -285,8 +447,14 @@ class MongoCalendarService:
         priority: str = "normal",
     ) -> Optional[Reminder]:
         """Create a reminder X minutes before an event."""
-        # Get the event
-        event = await self.get_event(user_id, event_id)
+        # Get just the fields we need from the event (skips the embedding)
+        try:
+            event = await CalendarEvent.find_one(
+                CalendarEvent.id == PydanticObjectId(event_id),
+                CalendarEvent.user_id == user_id,
+            ).project(CalendarEventView)
+        except Exception:
+            return None
         if not event:
             return None
 
@@ -307,6 +475,7 @@ class MongoCalendarService:
             notes=f"Reminder for event: {event.title}",
         )
         await reminder.insert()
+        _reminder_reads.invalidate(user_id)
         return reminder
 
     async def get_upcoming_reminders(
@@ -321,7 +490,7 @@ class MongoCalendarService:
                 Reminder.user_id == user_id,
                 Reminder.status == "pending",
                 Reminder.reminder_datetime >= now,
-                Reminder.reminder_datetime <= future,
+                Reminder.reminder_datetime < future,
             )
             .sort("reminder_datetime")
             .to_list()
@@ -331,6 +500,10 @@ class MongoCalendarService:
 
     async def get_pending_reminders(self, user_id: str) -> List[Reminder]:
         """Get all pending reminders for a user."""
+        cached = _reminder_reads.get(user_id, "pending")
+        if cached is not None:
+            return list(cached)
+
         reminders = (
             await Reminder.find(
                 Reminder.user_id == user_id,
@@ -340,18 +513,77 @@ class MongoCalendarService:
             .to_list()
         )
 
+        _reminder_reads.set(user_id, "pending", tuple(reminders))
         return reminders
 
+    async def get_reminder_dashboard(
+        self, user_id: str, hours_ahead: int = 24
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get pending and upcoming reminders in a single aggregation.
+
+        Both sets are pending reminders, so one indexed match feeds a $facet
+        that splits out the ones due within the next X hours; each facet
+        sorts its own list by reminder time.
+
+        Returns:
+            {"pending": [...], "upcoming": [...]} as raw reminder dicts
+        """
+        now = datetime.utcnow()
+        future = now + timedelta(hours=hours_ahead)
+
+        reminder_fields = {
+            "_id": 0,
+            "reminder_id": "$_id",
+            "title": 1,
+            "reminder_datetime": 1,
+            "event_id": 1,
+            "priority": 1,
+            "status": 1,
+        }
+        results = (
+            await Reminder.find(
+                Reminder.user_id == user_id,
+                Reminder.status == "pending",
+            )
+            .aggregate(
+                [
+                    {
+                        "$facet": {
+                            "pending": [
+                                {"$sort": {"reminder_datetime": 1}},
+                                {"$project": reminder_fields},
+                            ],
+                            "upcoming": [
+                                {
+                                    "$match": {
+                                        "reminder_datetime": {
+                                            "$gte": now,
+                                            "$lt": future,
+                                        }
+                                    }
+                                },
+                                {"$sort": {"reminder_datetime": 1}},
+                                {"$project": reminder_fields},
+                            ],
+                        }
+                    }
+                ]
+            )
+            .to_list()
+        )
+
+        return results[0] if results else {"pending": [], "upcoming": []}
+
     async def mark_reminder_completed(self, user_id: str, reminder_id: str) -> bool:
-        """Mark a reminder as completed."""
+        """Mark a reminder as completed (single round-trip)."""
         try:
-            reminder = await Reminder.get(PydanticObjectId(reminder_id))
-            if reminder and reminder.user_id == user_id:
-                await reminder.set(
-                    {"status": "completed", "updated_at": datetime.utcnow()}
-                )
-                return True
-            return False
+            result = await Reminder.find_one(
+                Reminder.id == PydanticObjectId(reminder_id),
+                Reminder.user_id == user_id,
+            ).update({"$set": {"status": "completed", "updated_at": datetime.utcnow()}})
+            _reminder_reads.invalidate(user_id)
+            return bool(result and result.matched_count)
         except Exception:
             return False
 
@@ -373,18 +605,20 @@ class MongoCalendarService:
                     "updated_at": datetime.utcnow(),
                 }
             )
+            _reminder_reads.invalidate(user_id)
             return reminder
         except Exception:
             return None
 
     async def delete_reminder(self, user_id: str, reminder_id: str) -> bool:
-        """Delete a reminder."""
+        """Delete a reminder (single round-trip, scoped to the owner)."""
         try:
-            reminder = await Reminder.get(PydanticObjectId(reminder_id))
-            if reminder and reminder.user_id == user_id:
-                await reminder.delete()
-                return True
-            return False
+            result = await Reminder.find_one(
+                Reminder.id == PydanticObjectId(reminder_id),
+                Reminder.user_id == user_id,
+            ).delete()
+            _reminder_reads.invalidate(user_id)
+            return bool(result and result.deleted_count)
         except Exception:
             return False
 
@@ -11,7 +11,7 @@ import random
 from ..models.keyslot import KeySlot
 from ..models.llmslot import LLMSlot
 from ..utils.redis_key_manager_util import get_all_openai_keys
-from ..config import OPENAI_MODEL, LOCK_EXPIRY
+from ..config import OPENAI_MODEL, OPENAI_FAST_MODEL, LOCK_EXPIRY
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +24,17 @@ class OpenAILLMPool:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self, model_name: str = OPENAI_MODEL):
+    def __init__(
+        self,
+        model_name: str = OPENAI_MODEL,
+        fast_model_name: str = OPENAI_FAST_MODEL,
+    ):
         # only run once
         if getattr(self, "_initialized", False):
             return
         self._initialized = True
         self.model_name = model_name
+        self.fast_model_name = fast_model_name
         self.initialize_slots()
 
     def initialize_slots(self):
@@ -44,7 +49,7 @@ class OpenAILLMPool:
             # Create a KeySlot for this API key
             key_slot = KeySlot(name, api_key)
             # Wrap it in an LLMSlot
-            llm_slot = LLMSlot(key_slot, self.model_name)
+            llm_slot = LLMSlot(key_slot, self.model_name, self.fast_model_name)
             self.slots.append(llm_slot)
 
         logger.info(
@@ -62,7 +67,7 @@ class OpenAILLMPool:
         self,
         tokens_needed: int,
         lock_expiry: int = int(LOCK_EXPIRY),
-        timeout_in_seconds: int = 0,
+        timeout_in_seconds: float = 0,
     ) -> tuple[LLMSlot, str]:
         """
         Borrow an LLM slot that can handle the requested number of tokens.
@@ -79,7 +84,7 @@ class OpenAILLMPool:
             TimeoutError: If no available slot is found within timeout period
         """
         expiry = (
-            asyncio.get_event_loop().time() + (timeout_in_seconds * 1000)
+            asyncio.get_event_loop().time() + timeout_in_seconds
             if timeout_in_seconds > 0
             else None
         )
@@ -89,8 +94,12 @@ class OpenAILLMPool:
         while True:
             random.shuffle(self.slots)
             for slot in self.slots:
-                # Check if slot can accept the request and is not locked
-                if slot.can_accept(tokens_needed) and not slot.is_locked():
+                # Check if slot can accept the request and is not locked.
+                # These are blocking Redis calls, so run them off the event
+                # loop to keep other sessions responsive.
+                if await asyncio.to_thread(
+                    self._is_slot_available, slot, tokens_needed
+                ):
                     try:
                         lock_token = await slot.acquire_lock(lock_expiry)
                         logger.info(
@@ -108,6 +117,11 @@ class OpenAILLMPool:
                     "No available LLM slot found within the timeout period."
                 )
 
+    @staticmethod
+    def _is_slot_available(slot: LLMSlot, tokens_needed: int) -> bool:
+        """Whether a slot has token headroom and isn't locked by another borrower."""
+        return slot.can_accept(tokens_needed) and not slot.is_locked()
+
     def return_llm(self, slot: LLMSlot, lock_token: str) -> None:
         """
         Return a borrowed LLM slot back to the pool.
@@ -178,5 +192,14 @@ class OpenAILLMPool:
         )
 
 
-# Singleton instance
-llmpool = OpenAILLMPool()
+# Singleton instance, created on first use so importing this module doesn't
+# read the key list from Redis
+_llmpool = None
+
+
+def get_llmpool() -> OpenAILLMPool:
+    """Get the singleton LLM pool, initializing it on first use."""
+    global _llmpool
+    if _llmpool is None:
+        _llmpool = OpenAILLMPool()
+    return _llmpool
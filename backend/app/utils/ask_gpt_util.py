@@ -10,6 +10,9 @@ from ..services.openai_keypool_service import keypool
 
 logger = logging.getLogger(__name__)
 
+# Suggested retry delay in OpenAI rate-limit error messages
+_RETRY_AFTER = re.compile(r"Please try again in ([\d.]+)s")
+
 
 # --- ask_gpt_async Function ---
 # should ideally acquire lock before calling this function
@@ -79,7 +82,7 @@ async def ask_gpt_async(
 
         # Handle rate limiting with suggested retry delay
         elif "rate limit reached" in error_msg or "Rate limit" in error_msg:
-            match = re.search(r"Please try again in ([\d.]+)s", error_msg)
+            match = _RETRY_AFTER.search(error_msg)
             if match:
                 delay = float(match.group(1))
                 logger.warning(
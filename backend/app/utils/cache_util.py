@@ -0,0 +1,56 @@
+"""
+Small in-process TTL cache partitioned by user.
+Lets read tools reuse recent results while write tools drop a single user's
+entries without touching anyone else's.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class UserTTLCache:
+    """
+    TTL cache keyed by (user_id, key), with per-user invalidation.
+
+    The least recently used users are evicted once more than `max_users`
+    have entries.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_users: int = 10_000):
+        self.ttl = ttl
+        self.max_users = max_users
+        self._entries: "OrderedDict[str, Dict[Hashable, Tuple[float, Any]]]" = (
+            OrderedDict()
+        )
+
+    def get(self, user_id: str, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        user_entries = self._entries.get(user_id)
+        if not user_entries:
+            return None
+
+        entry = user_entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del user_entries[key]
+            return None
+
+        self._entries.move_to_end(user_id)
+        return value
+
+    def set(self, user_id: str, key: Hashable, value: Any) -> None:
+        """Cache a value for this user until the TTL elapses."""
+        user_entries = self._entries.setdefault(user_id, {})
+        user_entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(user_id)
+
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop every cached entry for a user."""
+        self._entries.pop(user_id, None)
@@ -3,11 +3,13 @@ Utility for generating and comparing text embeddings using sentence-transformers
 Uses all-MiniLM-L6-v2 model for efficient semantic search.
 """
 
-from sentence_transformers import SentenceTransformer
 import numpy as np
-from typing import List
+from typing import List, TYPE_CHECKING
 import logging
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
 logger = logging.getLogger(__name__)
 
 # Load model once at module level (singleton pattern)
@@ -15,10 +17,14 @@ logger = logging.getLogger(__name__)
 _model = None
 
 
-def get_model() -> SentenceTransformer:
+def get_model() -> "SentenceTransformer":
     """Get or initialize the embedding model (singleton)."""
     global _model
     if _model is None:
+        # Imported here: sentence-transformers pulls in torch, which would
+        # otherwise be paid on every cold start before the first event write
+        from sentence_transformers import SentenceTransformer
+
         logger.info("Loading sentence-transformer model: all-MiniLM-L6-v2")
         _model = SentenceTransformer("all-MiniLM-L6-v2")
         logger.info("Model loaded successfully")
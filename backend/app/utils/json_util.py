@@ -0,0 +1,37 @@
+"""
+Fast JSON serialization helpers backed by orjson.
+Used wherever tool results and state are rendered as text for the LLM.
+"""
+
+from datetime import date, datetime, time
+from typing import Any
+
+import orjson
+
+
+def _minutes_default(value: Any) -> Any:
+    """orjson fallback that renders date/time values to minute precision."""
+    if isinstance(value, (datetime, time)):
+        return value.isoformat(timespec="minutes")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def to_json(value: Any, sort_keys: bool = False, minutes: bool = False) -> str:
+    """
+    Serialize a value to a compact JSON string.
+
+    datetimes are emitted natively as ISO 8601 to the second, or to the
+    minute with `minutes`; anything orjson doesn't know (e.g. ObjectId)
+    falls back to str(). With sort_keys the output is canonical, so equal
+    dicts serialize identically.
+    """
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_OMIT_MICROSECONDS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    default = str
+    if minutes:
+        option |= orjson.OPT_PASSTHROUGH_DATETIME
+        default = _minutes_default
+    return orjson.dumps(value, default=default, option=option).decode()
@@ -0,0 +1,43 @@
+"""
+Application logging setup with a background writer thread.
+Request-path handlers only enqueue records; a QueueListener thread owns the
+real stream handler, so slow console/file I/O never blocks the event loop.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    fmt: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+) -> None:
+    """
+    Route root logging through a queue drained by a background thread.
+
+    Safe to call more than once; only the first call installs handlers.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(fmt))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+    # Flush whatever is still queued when the process exits
+    atexit.register(_listener.stop)
@@ -15,6 +15,9 @@ from app.models.db.reminder import Reminder
 
 logger = logging.getLogger(__name__)
 
+# Shared pooled database handle, set by init_db and reused for raw access
+_database = None
+
 
 async def init_db(
     max_pool_size: int = 20,
@@ -60,7 +63,9 @@ async def init_db(
     )
 
     # Get database with timezone-aware codec options
+    global _database
     database = client.get_default_database().with_options(codec_options=codec_options)
+    _database = database
 
     logger.info("🔗 Initializing Beanie connection to MongoDB...")
     if "example" in MONGO_DB_URI:
@@ -79,6 +84,29 @@ async def init_db(
         ],
     )
 
+    # Backfill end_datetime on events stored before it existed; idempotent,
+    # and a no-op once every event has one
+    backfill = await database.events.update_many(
+        {"end_datetime": {"$exists": False}},
+        [
+            {
+                "$set": {
+                    "end_datetime": {
+                        "$add": ["$event_datetime", {"$multiply": ["$duration", 60000]}]
+                    }
+                }
+            }
+        ],
+    )
+    if backfill.modified_count:
+        logger.info(f"Backfilled end_datetime on {backfill.modified_count} event(s)")
+
+    # Raw conversation messages collection (not a Beanie model): recent
+    # messages are read by user + is_old, newest first
+    await database.messages.create_index(
+        [("user_id", 1), ("is_old", 1), ("created_at", -1)]
+    )
+
     logger.info("✅ Beanie ODM initialized successfully!")
 
 
@@ -86,9 +114,18 @@ async def get_mongo_database():
     """
     Get direct access to MongoDB database for raw collection operations.
 
+    Reuses the pooled client created by init_db so each call doesn't open a
+    fresh connection pool and handshake.
+
     Returns:
         AsyncIOMotorDatabase: MongoDB database instance
     """
-    codec_options = CodecOptions(tz_aware=True, tzinfo=timezone.utc)
-    client = AsyncIOMotorClient(MONGO_DB_URI)
-    return client.get_default_database().with_options(codec_options=codec_options)
+    global _database
+    if _database is None:
+        # init_db not run (e.g. standalone scripts) - create the pool once
+        codec_options = CodecOptions(tz_aware=True, tzinfo=timezone.utc)
+        client = AsyncIOMotorClient(MONGO_DB_URI)
+        _database = client.get_default_database().with_options(
+            codec_options=codec_options
+        )
+    return _database
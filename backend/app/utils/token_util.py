@@ -1,11 +1,33 @@
 import tiktoken
+from functools import lru_cache
 from typing import List, Any
 from ..models.gpt_model import GPTModel, GPT_4o_mini
 
 
+@lru_cache(maxsize=None)
+def _get_encoding(model_name: str) -> tiktoken.Encoding:
+    """Look up the tokenizer for a model once; unknown models use cl100k_base."""
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=512)
+def _count_text_tokens(text: str, model_name: str) -> int:
+    """
+    Token count of a string, memoized.
+
+    The agent re-estimates its whole transcript before every LLM call, but
+    earlier messages keep the same content strings (whose hash Python
+    caches), so only text added since the last iteration is encoded.
+    """
+    return len(_get_encoding(model_name).encode(text))
+
+
 # --- Token Estimation ---
 def num_tokens_from_string(string: str, gpt_model: GPTModel = GPT_4o_mini) -> int:
-    encoding = tiktoken.encoding_for_model(gpt_model.model_name)
+    encoding = _get_encoding(gpt_model.model_name)
     return len(encoding.encode(string))
 
 
@@ -22,11 +44,6 @@ def num_tokens_from_messages(
     Returns:
         Estimated token count
     """
-    try:
-        encoding = tiktoken.encoding_for_model(model_name)
-    except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
-
     num_tokens = 0
 
     for message in messages:
@@ -39,15 +56,15 @@ def num_tokens_from_messages(
         if hasattr(message, "content"):
             content = message.content
             if isinstance(content, str):
-                num_tokens += len(encoding.encode(content))
+                num_tokens += _count_text_tokens(content, model_name)
             elif isinstance(content, list):
                 # Handle structured content (for multimodal messages)
-                num_tokens += len(encoding.encode(str(content)))
+                num_tokens += _count_text_tokens(str(content), model_name)
 
         # Add tokens for tool calls if present
         if hasattr(message, "tool_calls") and message.tool_calls:
             for tool_call in message.tool_calls:
-                num_tokens += len(encoding.encode(str(tool_call)))
+                num_tokens += _count_text_tokens(str(tool_call), model_name)
 
     num_tokens += 2  # Every reply is primed with <im_start>assistant
 
@@ -10,6 +10,7 @@ import { fetchEventsRange } from '@/lib/api/calendar-api';
 export function useWebSocket() {
   const wsRef = useRef<WebSocketService | null>(null);
   const isInitializedRef = useRef(false); // ✅ Use ref instead of state
+  const streamingIdRef = useRef<string | null>(null); // Reply being streamed
   const chatStore = useChatStore();
   const calendarStore = useCalendarStore();
   const userId = process.env.NEXT_PUBLIC_USER_ID || 'user_123';
@@ -47,13 +48,33 @@ export function useWebSocket() {
       (data: ServerMessage) => {
         console.log('📥 Received from server:', data);
 
-        if (data.type === 'response') {
-          chatStore.addMessage({
-            id: Date.now().toString(),
-            role: 'assistant',
-            content: data.text,
-            timestamp: new Date(),
-          });
+        if (data.type === 'delta') {
+          // Grow the assistant reply as it streams in
+          if (streamingIdRef.current) {
+            chatStore.appendToMessage(streamingIdRef.current, data.text);
+          } else {
+            const id = Date.now().toString();
+            streamingIdRef.current = id;
+            chatStore.addMessage({
+              id,
+              role: 'assistant',
+              content: data.text,
+              timestamp: new Date(),
+            });
+          }
+        } else if (data.type === 'response') {
+          // The final text replaces whatever was streamed
+          if (streamingIdRef.current) {
+            chatStore.updateMessage(streamingIdRef.current, data.text);
+            streamingIdRef.current = null;
+          } else {
+            chatStore.addMessage({
+              id: Date.now().toString(),
+              role: 'assistant',
+              content: data.text,
+              timestamp: new Date(),
+            });
+          }
           chatStore.setLoading(false);
 
           // Sync calendar after receiving response
@@ -41,6 +41,8 @@ interface ChatState {
   isConnected: boolean;
 
   addMessage: (message: Message) => void;
+  appendToMessage: (id: string, text: string) => void;
+  updateMessage: (id: string, content: string) => void;
   setLoading: (loading: boolean) => void;
   setConnected: (connected: boolean) => void;
   clearMessages: () => void;
@@ -55,6 +57,18 @@ export const useChatStore = create<ChatState>((set) => ({
     messages: [...state.messages, message]
   })),
 
+  appendToMessage: (id, text) => set((state) => ({
+    messages: state.messages.map((m) =>
+      m.id === id ? { ...m, content: m.content + text } : m
+    )
+  })),
+
+  updateMessage: (id, content) => set((state) => ({
+    messages: state.messages.map((m) =>
+      m.id === id ? { ...m, content } : m
+    )
+  })),
+
   setLoading: (loading) => set({ isLoading: loading }),
   setConnected: (connected) => set({ isConnected: connected }),
   clearMessages: () => set({ messages: [] }),
@@ -79,6 +79,7 @@ export interface CalendarEventsResponse {
   end_date: string;
   events: CalendarEvent[];
   total: number;
+  truncated: boolean; // more events in the range than were returned
 }
 
 // ============================================
@@ -110,5 +111,6 @@ export type ClientMessage =
   | { type: 'ping' };
 
 export type ServerMessage =
+  | { type: 'delta'; text: string }
   | { type: 'response'; text: string }
   | { type: 'pong' };